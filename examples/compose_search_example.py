@@ -1,10 +1,14 @@
-import json
 import pathlib
 
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 from nav_insights.core.rules import evaluate_rules
 
 BASE = pathlib.Path(__file__).parent
-ir = json.loads((BASE / "sample_ir_search.json").read_text())
+ir = loads((BASE / "sample_ir_search.json").read_bytes())
 rules_path = str(
     BASE.parent / "nav_insights" / "domains" / "paid_search" / "rules" / "default.yaml"
 )
@@ -1 +1,9 @@
-from .core import *  # convenience re-export  # noqa: F403
+from .core import __all__  # convenience re-export, resolved lazily by nav_insights.core
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
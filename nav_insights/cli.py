@@ -9,10 +9,128 @@ managing schemas, and other nav-insights utilities.
 import json
 import sys
 import argparse
+import functools
+import glob
+import itertools
+import re
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Sequence, Tuple
 
-from jsonschema import Draft202012Validator
+try:  # optional fast JSON parser (pip install nav_insights[fast])
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+# 19+ digit runs may be integers outside orjson's 64-bit range, which it would
+# silently read as floats
+_WIDE_INT_DIGITS = re.compile(rb"\d{19}")
+
+
+def _loads(data: bytes | str) -> Any:
+    """Parse JSON exactly as json.loads would, using orjson when it agrees.
+
+    orjson rejects NaN/Infinity literals and out-of-range numbers, and turns
+    integers wider than 64 bits into floats; such input goes to json.loads so
+    validation results do not depend on whether orjson is installed.
+    """
+    if orjson is not None:
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        if not _WIDE_INT_DIGITS.search(raw):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # re-parse with the stdlib for its result or its error
+    return json.loads(data)
+
+
+# Schema keywords for which validating a value piece by piece is equivalent to
+# validating it whole (see validate_payload_stream): objects member by member,
+# arrays item by item. Nested schemas may not set $id, which would change how
+# $refs below them resolve.
+_ANNOTATION_KEYWORDS = frozenset({"$schema", "$defs", "$comment", "title", "description"})
+_STREAMABLE_OBJECT_KEYWORDS = _ANNOTATION_KEYWORDS | {
+    "type",
+    "properties",
+    "required",
+    "additionalProperties",
+}
+_STREAMABLE_ARRAY_KEYWORDS = _ANNOTATION_KEYWORDS | {"type", "items"}
+_STREAMABLE_KEYWORDS = _STREAMABLE_OBJECT_KEYWORDS | {"$id"}
+
+
+def _streams_as(schema: Any, kind: str, keywords: frozenset) -> bool:
+    if not (isinstance(schema, dict) and keywords.issuperset(schema)):
+        return False
+    if schema.get("type", kind) != kind:
+        return False
+    # additionalProperties: false reports all unexpected keys in one error
+    return schema.get("additionalProperties", True) is not False
+
+
+def _skip_value(events, event: str) -> None:
+    """Consume the rest of a JSON value whose first event was `event`."""
+    depth = event in ("start_map", "start_array")
+    while depth:
+        event, _ = next(events)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+
+
+def _build_value(builder, events, event: str, value: Any) -> Any:
+    """Materialize the JSON value whose first event was (event, value)."""
+    builder.event(event, value)
+    depth = event in ("start_map", "start_array")
+    while depth:
+        event, value = next(events)
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+    return builder.value
+
+
+def _format_path(parts) -> str:
+    """Readable error path; array indices are shown as [index]."""
+    if not parts:
+        return "root"
+    return " -> ".join(f"[{part}]" if isinstance(part, int) else str(part) for part in parts)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_validator(schema_path: str):
+    """Load a schema file and build its Draft 2020-12 validator once per process."""
+    # Imported lazily: jsonschema's import graph dominates CLI startup and
+    # is not needed for --help or --list-types.
+    from jsonschema import Draft202012Validator
+
+    with open(schema_path, "r") as f:
+        schema = json.load(f)
+    return Draft202012Validator(schema)
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_schemas(schemas_path: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Return sorted (domains, analyzer types) found under a schemas directory."""
+    root = Path(schemas_path)
+    domains = []
+    types = []
+    if root.exists():
+        for domain_dir in root.iterdir():
+            if domain_dir.is_dir() and not domain_dir.name.startswith("."):
+                domains.append(domain_dir.name)
+                for schema_file in domain_dir.glob("*.json"):
+                    # Convert filename to analyzer type (e.g., keyword_analyzer.json -> paid_search.keyword_analyzer)
+                    types.append(f"{domain_dir.name}.{schema_file.stem}")
+    return tuple(sorted(domains)), tuple(sorted(types))
+
+
+def clear_schema_cache() -> None:
+    """Forget discovered schema files and compiled validators (e.g. in tests)."""
+    _scan_schemas.cache_clear()
+    _get_validator.cache_clear()
 
 
 class ValidatorCLI:
@@ -22,33 +140,24 @@ class ValidatorCLI:
         self.base_path = Path(__file__).parent.parent
         self.schemas_path = self.base_path / "schemas"
         self._schema_cache: Dict[str, Dict[str, Any]] = {}
+        # id(schema) -> (schema, validator); the schema is kept to guard against id reuse
+        self._validator_cache: Dict[int, Tuple[Dict[str, Any], Any]] = {}
+        self._schema_path_cache: Dict[str, Path] = {}
 
     def get_supported_domains(self) -> List[str]:
         """Get list of supported analyzer domains."""
-        domains = []
-        if self.schemas_path.exists():
-            for domain_dir in self.schemas_path.iterdir():
-                if domain_dir.is_dir() and not domain_dir.name.startswith("."):
-                    domains.append(domain_dir.name)
-        return sorted(domains)
+        return list(_scan_schemas(str(self.schemas_path))[0])
 
     def get_available_types(self) -> List[str]:
         """Get list of available analyzer types for validation."""
-        types = []
-
-        # Check all domain directories
-        for domain in self.get_supported_domains():
-            domain_path = self.schemas_path / domain
-            if domain_path.exists():
-                for schema_file in domain_path.glob("*.json"):
-                    # Convert filename to analyzer type (e.g., keyword_analyzer.json -> paid_search.keyword_analyzer)
-                    analyzer_name = schema_file.stem
-                    types.append(f"{domain}.{analyzer_name}")
-
-        return sorted(types)
+        return list(_scan_schemas(str(self.schemas_path))[1])
 
     def get_schema_path(self, analyzer_type: str) -> Path:
         """Get the schema file path for a given analyzer type."""
+        cached = self._schema_path_cache.get(analyzer_type)
+        if cached is not None:
+            return cached
+
         if "." not in analyzer_type:
             supported_domains = self.get_supported_domains()
             raise ValueError(
@@ -70,6 +179,7 @@ class ValidatorCLI:
         if not schema_path.exists():
             raise ValueError(f"Schema not found for analyzer type: {analyzer_type}")
 
+        self._schema_path_cache[analyzer_type] = schema_path
         return schema_path
 
     def load_schema(self, analyzer_type: str) -> Dict[str, Any]:
@@ -79,25 +189,26 @@ class ValidatorCLI:
             return self._schema_cache[analyzer_type]
 
         schema_path = self.get_schema_path(analyzer_type)
-
-        with open(schema_path, "r") as f:
-            schema = json.load(f)
+        validator = _get_validator(str(schema_path))
+        schema = validator.schema
 
         # Validate that the schema itself is valid
         if not self.validate_schema_itself(schema):
             raise ValueError(f"Invalid JSON schema for analyzer type: {analyzer_type}")
 
-        # Cache the schema for future use
+        # Cache the schema (and its compiled validator) for future use
         self._schema_cache[analyzer_type] = schema
+        self._validator_cache[id(schema)] = (schema, validator)
         return schema
 
     def load_payload(self, input_path: str) -> Dict[str, Any]:
         """Load payload from file or stdin."""
+        # Raw bytes go straight to the parser, skipping the text decoding layer
         if input_path == "-":
-            # Read from stdin
+            # Read from stdin (binary buffer when available)
             try:
-                return json.load(sys.stdin)
-            except json.JSONDecodeError as e:
+                return _loads(getattr(sys.stdin, "buffer", sys.stdin).read())
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
                 raise ValueError(f"Invalid JSON from stdin: {e}")
         else:
             # Read from file
@@ -106,44 +217,145 @@ class ValidatorCLI:
                 raise ValueError(f"Input file not found: {input_path}")
 
             try:
-                with open(file_path, "r") as f:
-                    return json.load(f)
-            except json.JSONDecodeError as e:
+                return _loads(file_path.read_bytes())
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
                 raise ValueError(f"Invalid JSON in file {input_path}: {e}")
 
     def validate_payload(
-        self, payload: Dict[str, Any], schema: Dict[str, Any]
+        self, payload: Dict[str, Any], schema: Dict[str, Any], collect_errors: bool = True
     ) -> tuple[bool, List[str]]:
-        """Validate payload against schema. Returns (is_valid, error_messages)."""
-        validator = Draft202012Validator(schema)
-        errors = []
-
-        for error in validator.iter_errors(payload):
-            # Format error message with better array index formatting
-            if error.absolute_path:
-                path_parts = []
-                for part in error.absolute_path:
-                    if isinstance(part, int):
-                        # Format array indices as [index] instead of just index
-                        path_parts.append(f"[{part}]")
-                    else:
-                        path_parts.append(str(part))
-                path = " -> ".join(path_parts)
-            else:
-                path = "root"
-            errors.append(f"At '{path}': {error.message}")
+        """Validate payload against schema. Returns (is_valid, error_messages).
+
+        With collect_errors=False only a pass/fail check is made (no error
+        objects or messages are built) and the message list is always empty.
+        """
+        validator = self._get_validator_for(schema)
+        if not collect_errors:
+            return validator.is_valid(payload), []
+
+        errors = [self._format_error(error) for error in validator.iter_errors(payload)]
+        return len(errors) == 0, errors
+
+    def validate_payload_stream(
+        self, input_path: str, schema: Dict[str, Any]
+    ) -> tuple[bool, List[str]]:
+        """Validate a payload without materializing the whole document.
+
+        The payload is parsed incrementally with ijson. Objects whose schema
+        only uses type/properties/required/additionalProperties are checked
+        member by member, arrays whose schema only uses type/items item by
+        item, and values any schema accepts (e.g. additionalProperties: true)
+        are skipped unparsed. Other values are built and validated whole, so
+        peak memory is bounded by the largest such value (typically one
+        finding) rather than the document. Root schemas using other keywords
+        fall back to a regular load.
+        """
+        if not _streams_as(schema, "object", _STREAMABLE_KEYWORDS):
+            return self.validate_payload(self.load_payload(input_path), schema)
+
+        try:
+            import ijson
+        except ImportError:
+            raise ValueError("--stream requires ijson (pip install 'nav_insights[stream]')")
+
+        validator = self._get_validator_for(schema)
+
+        if input_path == "-":
+            source = getattr(sys.stdin, "buffer", sys.stdin)
+        else:
+            if not Path(input_path).exists():
+                raise ValueError(f"Input file not found: {input_path}")
+            source = open(input_path, "rb")
+
+        try:
+            events = ((event, value) for _, event, value in ijson.parse(source, use_float=True))
+            first = next(events, None)
+            if first is None or first[0] != "start_map":
+                return False, ["At 'root': payload is not of type 'object'"]
+            errors = list(self._stream_errors(ijson, validator, events, *first, schema, ()))
+        except ijson.JSONError as e:
+            input_desc = "stdin" if input_path == "-" else f"file {input_path}"
+            raise ValueError(f"Invalid JSON in {input_desc}: {e}")
+        finally:
+            if input_path != "-":
+                source.close()
 
         return len(errors) == 0, errors
 
+    def _stream_errors(
+        self, ijson, validator, events, event: str, value: Any, schema: Any, path: Tuple
+    ):
+        """Yield error messages for the JSON value starting at (event, value)."""
+        if schema is True or (isinstance(schema, dict) and _ANNOTATION_KEYWORDS.issuperset(schema)):
+            _skip_value(events, event)
+            return
+        if event == "start_map" and (
+            not path or _streams_as(schema, "object", _STREAMABLE_OBJECT_KEYWORDS)
+        ):
+            properties = schema.get("properties", {})
+            additional = schema.get("additionalProperties", True)
+            seen = set()
+            for event, key in events:
+                if event == "end_map":
+                    break
+                seen.add(key)
+                yield from self._stream_errors(
+                    ijson,
+                    validator,
+                    events,
+                    *next(events),
+                    properties.get(key, additional),
+                    path + (key,),
+                )
+            for name in schema.get("required", []):
+                if name not in seen:
+                    yield f"At '{_format_path(path)}': '{name}' is a required property"
+            return
+        if event == "start_array" and _streams_as(schema, "array", _STREAMABLE_ARRAY_KEYWORDS):
+            items = schema.get("items", True)
+            for index in itertools.count():
+                event, value = next(events)
+                if event == "end_array":
+                    break
+                yield from self._stream_errors(
+                    ijson, validator, events, event, value, items, path + (index,)
+                )
+            return
+        instance = _build_value(ijson.ObjectBuilder(), events, event, value)
+        for error in validator.descend(instance, schema):
+            error.path.extendleft(reversed(path))
+            yield self._format_error(error)
+
+    @staticmethod
+    def _format_error(error) -> str:
+        """Format a jsonschema error with a readable path."""
+        return f"At '{_format_path(error.absolute_path)}': {error.message}"
+
+    def _get_validator_for(self, schema: Dict[str, Any]):
+        """Return a cached validator for a schema dict, building it on first use."""
+        cached = self._validator_cache.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+
+        from jsonschema import Draft202012Validator
+
+        validator = Draft202012Validator(schema)
+        self._validator_cache[id(schema)] = (schema, validator)
+        return validator
+
     def validate_schema_itself(self, schema: Dict[str, Any]) -> bool:
         """Validate that the schema is a valid JSON schema."""
+        from jsonschema import Draft202012Validator
+
         try:
             Draft202012Validator.check_schema(schema)
             return True
         except Exception:
             return False
 
-    def run_validate(self, analyzer_type: str, input_path: str, verbose: bool = False) -> int:
+    def run_validate(
+        self, analyzer_type: str, input_path: str, verbose: bool = False, stream: bool = False
+    ) -> int:
         """Run validation and return exit code."""
         try:
             # Load schema
@@ -151,16 +363,25 @@ class ValidatorCLI:
                 print(f"Loading schema for: {analyzer_type}")
             schema = self.load_schema(analyzer_type)
 
-            # Load payload
-            if verbose:
-                input_desc = "stdin" if input_path == "-" else input_path
-                print(f"Loading payload from: {input_desc}")
-            payload = self.load_payload(input_path)
-
-            # Validate
-            if verbose:
-                print("Validating payload...")
-            is_valid, errors = self.validate_payload(payload, schema)
+            if stream:
+                if verbose:
+                    input_desc = "stdin" if input_path == "-" else input_path
+                    print(f"Streaming payload from: {input_desc}")
+                is_valid, errors = self.validate_payload_stream(input_path, schema)
+            else:
+                # Load payload
+                if verbose:
+                    input_desc = "stdin" if input_path == "-" else input_path
+                    print(f"Loading payload from: {input_desc}")
+                payload = self.load_payload(input_path)
+
+                # Validate
+                if verbose:
+                    print("Validating payload...")
+                # Cheap pass/fail check first; only build error messages on failure
+                is_valid, errors = self.validate_payload(payload, schema, collect_errors=False)
+                if not is_valid:
+                    is_valid, errors = self.validate_payload(payload, schema)
 
             if is_valid:
                 print("✅ Payload is valid")
@@ -175,6 +396,24 @@ class ValidatorCLI:
             print(f"Error: {e}", file=sys.stderr)
             return 1
 
+    def run_validate_many(
+        self,
+        analyzer_type: str,
+        input_paths: Sequence[str],
+        verbose: bool = False,
+        stream: bool = False,
+    ) -> int:
+        """Validate several payloads against one schema in a single process.
+
+        The schema and its compiled validator are loaded once and reused for
+        every input. Returns 1 if any input fails, else 0.
+        """
+        exit_code = 0
+        for input_path in input_paths:
+            print(f"{input_path}:")
+            exit_code |= self.run_validate(analyzer_type, input_path, verbose, stream)
+        return exit_code
+
     def list_types(self) -> int:
         """List available analyzer types."""
         types = self.get_available_types()
@@ -190,6 +429,15 @@ class ValidatorCLI:
         return 0
 
 
+def _expand_inputs(patterns: Sequence[str]) -> List[str]:
+    """Expand glob patterns in --input; patterns matching nothing are kept as-is."""
+    paths: List[str] = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else []
+        paths.extend(matches or [pattern])
+    return paths
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -203,6 +451,9 @@ Examples:
   # Validate from stdin
   cat data.json | nav-insights validate --type paid_search.search_terms --input -
   
+  # Validate many files in one run
+  nav-insights validate --type paid_search.keyword_analyzer --input 'payloads/*.json'
+  
   # List available types
   nav-insights validate --list-types
         """,
@@ -217,13 +468,22 @@ Examples:
     )
     validate_parser.add_argument(
         "--input",
-        dest="input_path",
-        default="-",
-        help="Input file path or '-' for stdin (default: stdin)",
+        dest="input_paths",
+        nargs="+",
+        default=["-"],
+        help="Input file paths or glob patterns, or '-' for stdin (default: stdin)",
     )
     validate_parser.add_argument(
         "--list-types", action="store_true", help="List available analyzer types"
     )
+    validate_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Parse the payload incrementally, validating arrays item by item, so memory "
+            "is bounded by the largest item rather than the input (requires ijson)"
+        ),
+    )
     validate_parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
 
     args = parser.parse_args()
@@ -232,9 +492,9 @@ Examples:
         parser.print_help()
         return 1
 
-    cli = ValidatorCLI()
-
     if args.command == "validate":
+        # Only built once a command needs it; --help and bare invocations exit above
+        cli = ValidatorCLI()
         if args.list_types:
             return cli.list_types()
 
@@ -243,7 +503,10 @@ Examples:
             validate_parser.print_help()
             return 1
 
-        return cli.run_validate(args.analyzer_type, args.input_path, args.verbose)
+        input_paths = _expand_inputs(args.input_paths)
+        if len(input_paths) == 1:
+            return cli.run_validate(args.analyzer_type, input_paths[0], args.verbose, args.stream)
+        return cli.run_validate_many(args.analyzer_type, input_paths, args.verbose, args.stream)
 
     parser.print_help()
     return 1
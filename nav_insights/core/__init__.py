@@ -1,33 +1,40 @@
-"""Core utilities and error handling for nav_insights."""
-
-from .errors import (
-    CoreError,
-    ValidationError,
-    ParserError,
-    NegativeMetricError,
-    ErrorCode,
-    wrap_exception,
-)
-from .utils import (
-    map_priority_level,
-    generate_finding_id,
-    validate_non_negative_metrics,
-    safe_decimal_conversion,
-    validate_required_fields,
-)
-
-__all__ = [
+"""Core utilities and error handling for nav_insights.
+
+Re-exported names are resolved lazily (PEP 562) so importing a single core
+submodule does not pull in the errors/utils import graph (and pydantic).
+"""
+
+from importlib import import_module
+
+# name -> submodule that defines it
+_LAZY = {
     # Error classes
-    "CoreError",
-    "ValidationError",
-    "ParserError",
-    "NegativeMetricError",
-    "ErrorCode",
-    "wrap_exception",
+    "CoreError": ".errors",
+    "ValidationError": ".errors",
+    "ParserError": ".errors",
+    "NegativeMetricError": ".errors",
+    "ErrorCode": ".errors",
+    "wrap_exception": ".errors",
     # Utility functions
-    "map_priority_level",
-    "generate_finding_id",
-    "validate_non_negative_metrics",
-    "safe_decimal_conversion",
-    "validate_required_fields",
-]
+    "map_priority_level": ".utils",
+    "generate_finding_id": ".utils",
+    "validate_non_negative_metrics": ".utils",
+    "safe_decimal_conversion": ".utils",
+    "to_decimal": ".utils",
+    "validate_required_fields": ".utils",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(module, __name__), name)
+    globals()[name] = attr  # cache so later lookups bypass __getattr__
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
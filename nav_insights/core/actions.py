@@ -1,15 +1,27 @@
 from __future__ import annotations
+import sys
 from typing import Any, Dict, Optional, Literal
-from pydantic import BaseModel, Field, confloat
+from pydantic import BaseModel, ConfigDict, Field, confloat, field_validator
+
+
+def _intern(v: Any) -> Any:
+    # Labels repeat across thousands of actions; share one string object each
+    return sys.intern(v) if type(v) is str else v
 
 
 class ActionImpact(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     spend_savings_usd: Optional[float] = None
     revenue_lift_usd: Optional[float] = None
     risk: Literal["low", "medium", "high"] = "low"
 
+    _intern_risk = field_validator("risk", mode="before")(_intern)
+
 
 class Action(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     type: Literal[
         "tighten_match_types",
@@ -28,3 +40,5 @@ class Action(BaseModel):
     priority: int = Field(3, ge=1, le=5)
     confidence: confloat(ge=0.0, le=1.0) = 0.85
     source_rule_id: Optional[str] = None
+
+    _intern_labels = field_validator("type", "target", "source_rule_id", mode="before")(_intern)
@@ -1,7 +1,13 @@
 from __future__ import annotations
 import ast
 import operator as op
-from typing import Any, Dict, Callable, Optional
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, Callable, Iterable, List, Optional, Tuple
+
+from pydantic.functional_serializers import PlainSerializer, WrapSerializer
 
 # Use stable exception classes to avoid identity changes on reload
 from .dsl_exceptions import (
@@ -13,6 +19,16 @@ from .dsl_exceptions import (
 )
 
 
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> Tuple[Tuple[str, bool], ...]:
+    """Split a dotted path once into (segment, is_last) pairs.
+
+    Rules reuse a small pool of literal paths, so this is almost always a hit.
+    """
+    parts = path.split(".")
+    return tuple((part, i == len(parts) - 1) for i, part in enumerate(parts))
+
+
 def value(path: str, root: Any, default=None) -> Any:
     """Safely access a dotted path on nested dicts/objects.
 
@@ -27,29 +43,129 @@ def value(path: str, root: Any, default=None) -> Any:
     - This prevents AttributeError/KeyError exceptions during path traversal
     """
     cur = root
-    for part in path.split("."):
-        if cur is None:
-            return default
-        if isinstance(cur, dict):
+    for part, last in _split_path(path):
+        if type(cur) is dict:
+            # Fast path: plain dict trees (e.g. JSON-loaded or model_dump()'d IR)
             cur = cur.get(part)
-        elif hasattr(cur, "model_dump"):
-            # Pydantic model - convert to dict for safe access
-            try:
-                cur = cur.model_dump().get(part)
-            except Exception:
-                return default
-        elif hasattr(cur, "__getitem__") and hasattr(cur, "get"):
-            # Dict-like object with get method
-            try:
-                cur = cur.get(part)
-            except Exception:
-                return default
-        else:
-            # Unsupported object type - reject for security
+        elif cur is None:
             return default
+        else:
+            cur = _step(cur, part, last)
     return cur if cur is not None else default
 
 
+# Field values model_dump() returns unchanged (python mode), so they can be read directly
+_PLAIN_VALUES = frozenset({str, int, float, bool, Decimal, date, datetime})
+
+
+def _step_mapping(cur: Any, part: str, last: bool) -> Any:
+    return cur.get(part)
+
+
+# type -> Pydantic fields model_dump() returns as stored, so they can be read with
+# getattr (None for non-models and for models with a model_serializer, which are
+# always dumped); read once per type because `model_fields` is a comparatively
+# slow class property
+_MODEL_FIELDS: Dict[type, Optional[frozenset]] = {}
+
+
+def _model_fields(cls: type) -> Optional[frozenset]:
+    try:
+        return _MODEL_FIELDS[cls]
+    except KeyError:
+        names = _direct_fields(cls)
+        if len(_MODEL_FIELDS) >= 1024:
+            _MODEL_FIELDS.clear()
+        _MODEL_FIELDS[cls] = names
+        return names
+
+
+def _direct_fields(cls: type) -> Optional[frozenset]:
+    fields = getattr(cls, "model_fields", None)
+    if not isinstance(fields, dict):
+        return None
+    serialized: set = set()
+    decorators = getattr(cls, "__pydantic_decorators__", None)
+    if decorators is not None:
+        if decorators.model_serializers:
+            return None
+        for decorator in decorators.field_serializers.values():
+            serialized.update(decorator.info.fields)
+    if "*" in serialized:
+        return frozenset()
+    # Excluded fields dump as absent and serializer-backed ones dump transformed
+    return frozenset(
+        name
+        for name, info in fields.items()
+        if name not in serialized
+        and not info.exclude
+        and not any(isinstance(m, (PlainSerializer, WrapSerializer)) for m in info.metadata)
+    )
+
+
+def _step_model(cur: Any, part: str, last: bool) -> Any:
+    # Read as if dumped with model_dump(), touching only the requested field:
+    # plain declared fields are read via getattr, nested models are walked
+    # without dumping, and anything else (non-scalar values at the end of the
+    # path, excluded, serializer-backed, computed or extra fields) is dumped
+    # on its own with model_dump(include={part}).
+    try:
+        fields = _model_fields(type(cur))
+        if fields is None:
+            return cur.model_dump().get(part)
+        if part not in fields:
+            return cur.model_dump(include={part}).get(part)
+        attr = getattr(cur, part)
+        if attr is None or type(attr) in _PLAIN_VALUES or isinstance(attr, Enum):
+            return attr
+        if not last and _model_fields(type(attr)) is not None:
+            return attr
+        return cur.model_dump(include={part}).get(part)
+    except Exception:
+        return None
+
+
+def _step_dict_like(cur: Any, part: str, last: bool) -> Any:
+    try:
+        return cur.get(part)
+    except Exception:
+        return None
+
+
+def _step_probe(cur: Any, part: str, last: bool) -> Any:
+    # Per-instance checks for types without class-level support (e.g. objects
+    # given a `get` attribute at runtime)
+    if hasattr(cur, "model_dump"):
+        return _step_model(cur, part, last)
+    if hasattr(cur, "__getitem__") and hasattr(cur, "get"):
+        return _step_dict_like(cur, part, last)
+    return None
+
+
+# type -> step function, classified on first sight of each type
+_STEP_BY_TYPE: Dict[type, Callable[[Any, str, bool], Any]] = {}
+
+
+def _step(cur: Any, part: str, last: bool = True) -> Any:
+    """One non-dict segment of value(); None stands in for `default`."""
+    step = _STEP_BY_TYPE.get(type(cur))
+    if step is None:
+        cls = type(cur)
+        if issubclass(cls, dict):
+            step = _step_mapping
+        elif hasattr(cls, "model_dump"):
+            step = _step_model
+        elif hasattr(cls, "__getitem__") and hasattr(cls, "get"):
+            step = _step_dict_like
+        else:
+            return _step_probe(cur, part, last)
+        if len(_STEP_BY_TYPE) >= 1024:
+            # Bound growth from dynamically created classes (e.g. mocks)
+            _STEP_BY_TYPE.clear()
+        _STEP_BY_TYPE[cls] = step
+    return step(cur, part, last)
+
+
 class DSLRegistry:
     """Registry for DSL functions and accessors that can be extended by domain packs.
 
@@ -65,6 +181,8 @@ class DSLRegistry:
         self._accessors: Dict[str, Callable] = {
             "value": self._make_value_accessor,
         }
+        # name -> `(root, *args)` caller; rebuilt whenever the registry changes
+        self._resolved: Dict[str, Callable] = {}
 
     def register_function(self, name: str, func: Callable) -> None:
         """Register a safe function for use in DSL expressions.
@@ -81,6 +199,7 @@ class DSLRegistry:
         if not callable(func):
             raise ValueError(f"Function '{name}' must be callable")
         self._functions[name] = func
+        self._resolved.clear()
 
     def register_accessor(self, name: str, func: Callable) -> None:
         """Register a safe accessor function for use in DSL expressions.
@@ -94,9 +213,13 @@ class DSLRegistry:
         """
         if name in self._accessors:
             raise ValueError(f"Accessor '{name}' is already registered")
+        if name in ALLOWED_FUNCS:
+            # Built-ins are folded at compile time, so they must not be shadowed
+            raise ValueError(f"Accessor '{name}' would shadow a built-in function")
         if not callable(func):
             raise ValueError(f"Accessor '{name}' must be callable")
         self._accessors[name] = func
+        self._resolved.clear()
 
     def get_function(self, name: str) -> Optional[Callable]:
         """Get a registered function by name."""
@@ -118,6 +241,38 @@ class DSLRegistry:
         """Clear all registered functions and accessors (except built-ins)."""
         self._functions = {"min": min, "max": max}
         self._accessors = {"value": self._make_value_accessor}
+        self._resolved = {}
+
+    def resolve(self, name: str) -> Callable:
+        """Return a `(root, *args) -> result` caller for a DSL function name.
+
+        Accessors take precedence over functions.
+        The lookup is done once per name and cached until the registry changes.
+
+        Raises:
+            HelperNotFoundError: If no accessor or function has this name
+        """
+        caller = self._resolved.get(name)
+        if caller is None:
+            caller = self._resolved[name] = self._build_caller(name)
+        return caller
+
+    def _build_caller(self, name: str) -> Callable:
+        accessor_factory = self.get_accessor(name)
+        if accessor_factory:
+            return lambda root, *args: accessor_factory(root)(*args)
+
+        func = self.get_function(name)
+        if not func:
+            raise HelperNotFoundError(f"Function '{name}' not found")
+
+        def call(root, *args):
+            try:
+                return func(*args)
+            except Exception as e:
+                raise ExpressionError(f"Function '{name}' error: {e}")
+
+        return call
 
     def _make_value_accessor(self, root: Any) -> Callable:
         """Create a value accessor function bound to a root context."""
@@ -147,7 +302,8 @@ def register_dsl_accessor(name: str, func: Callable) -> None:
     _registry.register_accessor(name, func)
 
 
-# Legacy compatibility - maintaining the old ALLOWED_FUNCS for backward compatibility
+# Legacy compatibility - maintaining the old ALLOWED_FUNCS for backward compatibility.
+# Not consulted at evaluation time: every registry is seeded with min/max.
 ALLOWED_FUNCS = {"min": min, "max": max}
 
 
@@ -177,8 +333,18 @@ UNARY_OPS = {
 }
 
 
-class SafeEval(ast.NodeVisitor):
-    """Safe AST evaluator with resource limits and graceful None handling."""
+class SafeEval:
+    """Safe AST evaluator with resource limits and graceful None handling.
+
+    This is the reference tree-walking interpreter. `eval_expr` uses the compiled
+    path below, which implements the same semantics; SafeEval is kept for callers
+    that drive the evaluator directly.
+
+    It dispatches through its own handler table rather than ast.NodeVisitor, so
+    instances use __slots__ and carry no per-instance __dict__.
+    """
+
+    __slots__ = ("ctx", "registry", "max_depth", "current_depth", "_value", "_funcs")
 
     def __init__(
         self, ctx: Dict[str, Any], registry: Optional[DSLRegistry] = None, max_depth: int = 25
@@ -187,6 +353,9 @@ class SafeEval(ast.NodeVisitor):
         self.registry = registry or _registry
         self.max_depth = max_depth
         self.current_depth = 0
+        # Bind the hot lookups once instead of per Call node
+        self._value = ctx.get("value")
+        self._funcs = self.registry.list_functions()
 
     def visit(self, node):
         # Check depth limit
@@ -195,29 +364,24 @@ class SafeEval(ast.NodeVisitor):
             raise ResourceLimitError(f"Expression AST depth exceeds limit of {self.max_depth}")
 
         try:
-            if isinstance(node, ast.Expression):
-                return self.visit(node.body)
-            elif isinstance(node, ast.Constant):
-                return node.value
-            elif isinstance(node, ast.Name):
-                if node.id in ("True", "False", "None"):
-                    return {"True": True, "False": False, "None": None}[node.id]
-                raise UnsupportedNodeError(f"Name not allowed: {node.id}")
-            elif isinstance(node, ast.BinOp):
-                return self._handle_binop(node)
-            elif isinstance(node, ast.BoolOp):
-                return self._handle_boolop(node)
-            elif isinstance(node, ast.UnaryOp):
-                return self._handle_unaryop(node)
-            elif isinstance(node, ast.Compare):
-                return self._handle_compare(node)
-            elif isinstance(node, ast.Call):
-                return self._handle_call(node)
-            else:
+            handler = self._HANDLERS.get(type(node))
+            if handler is None:
                 raise UnsupportedNodeError(f"Node not allowed: {type(node).__name__}")
+            return handler(self, node)
         finally:
             self.current_depth -= 1
 
+    def _handle_expression(self, node: ast.Expression) -> Any:
+        return self.visit(node.body)
+
+    def _handle_constant(self, node: ast.Constant) -> Any:
+        return node.value
+
+    def _handle_name(self, node: ast.Name) -> Any:
+        if node.id in ("True", "False", "None"):
+            return {"True": True, "False": False, "None": None}[node.id]
+        raise UnsupportedNodeError(f"Name not allowed: {node.id}")
+
     def _handle_binop(self, node: ast.BinOp) -> Any:
         """Handle binary operations with graceful None handling."""
         left = self.visit(node.left)
@@ -285,29 +449,14 @@ class SafeEval(ast.NodeVisitor):
         left = self.visit(node.left)
 
         for op_node, comparator in zip(node.ops, node.comparators):
+            # Per-operator functions carry the None semantics (see _comparison_helper)
+            compare = _COMPARE_FUNCS.get(type(op_node))
+            if compare is None:
+                raise UnsupportedNodeError(
+                    f"Comparison operator not allowed: {type(op_node).__name__}"
+                )
             right = self.visit(comparator)
-
-            # Special handling for None comparisons
-            if left is None and right is None:
-                # None == None is True, other comparisons with None are False
-                result = isinstance(op_node, ast.Eq)
-            elif left is None or right is None:
-                # One is None, other is not: only != is True
-                result = isinstance(op_node, ast.NotEq)
-            else:
-                # Normal comparison
-                op_func = COMPARISON_OPS.get(type(op_node))
-                if not op_func:
-                    raise UnsupportedNodeError(
-                        f"Comparison operator not allowed: {type(op_node).__name__}"
-                    )
-
-                try:
-                    result = op_func(left, right)
-                except (TypeError, ValueError) as e:
-                    raise ExpressionError(f"Comparison error: {e}")
-
-            if not result:
+            if not compare(left, right):
                 return False
             left = right  # For chained comparisons
         return True
@@ -325,10 +474,8 @@ class SafeEval(ast.NodeVisitor):
             args = [self.visit(a) for a in node.args]
             # Special handling for value accessor
             if func_name == "value":
-                if len(args) == 1 and isinstance(args[0], str):
-                    return self.ctx["value"](args[0])
-                if len(args) == 2 and isinstance(args[0], str):
-                    return self.ctx["value"](args[0], args[1])
+                if len(args) in (1, 2) and isinstance(args[0], str):
+                    return self._value(*args)
                 raise ExpressionError("value() requires 'path' or ('path', default)")
             else:
                 # For other accessors, pass all args
@@ -336,7 +483,7 @@ class SafeEval(ast.NodeVisitor):
                 return accessor_func(*args)
 
         # Try registered functions
-        func = self.registry.get_function(func_name)
+        func = self._funcs.get(func_name)
         if func:
             args = [self.visit(a) for a in node.args]
             try:
@@ -344,17 +491,448 @@ class SafeEval(ast.NodeVisitor):
             except Exception as e:
                 raise ExpressionError(f"Function '{func_name}' error: {e}")
 
-        # Legacy compatibility - check ALLOWED_FUNCS
-        if func_name in ALLOWED_FUNCS:
-            f = ALLOWED_FUNCS[func_name]
-            args = [self.visit(a) for a in node.args]
-            try:
-                return f(*args)
-            except Exception as e:
-                raise ExpressionError(f"Built-in function '{func_name}' error: {e}")
-
         raise HelperNotFoundError(f"Function '{func_name}' not found")
 
+    # Node type -> handler; one dict lookup per node instead of an isinstance chain
+    _HANDLERS = {
+        ast.Expression: _handle_expression,
+        ast.Constant: _handle_constant,
+        ast.Name: _handle_name,
+        ast.BinOp: _handle_binop,
+        ast.BoolOp: _handle_boolop,
+        ast.UnaryOp: _handle_unaryop,
+        ast.Compare: _handle_compare,
+        ast.Call: _handle_call,
+    }
+
+
+# ---------- Compiled evaluation ----------
+#
+# Expressions are validated once, lowered to calls into the sandboxed helpers
+# below (which carry the graceful None semantics of SafeEval), compiled to a
+# plain `(root, registry)` function and cached by expression string. Evaluation
+# is then a single call into trusted bytecode: user expressions can never
+# reference a Name, so the only names reachable from the function are its two
+# arguments and the helpers themselves.
+
+
+def _arithmetic_helper(fn: Callable) -> Callable:
+    def apply(left, right):
+        if left is None or right is None:
+            return None
+        try:
+            return fn(left, right)
+        except (TypeError, ZeroDivisionError, ValueError) as e:
+            raise ExpressionError(f"Arithmetic error: {e}")
+
+    return apply
+
+
+def _comparison_helper(op_type: type, fn: Callable) -> Callable:
+    # None == None is True, other comparisons with None are False (except !=)
+    both_none = op_type is ast.Eq
+    one_none = op_type is ast.NotEq
+
+    def apply(left, right):
+        if left is None or right is None:
+            return both_none if left is right else one_none
+        try:
+            return fn(left, right)
+        except (TypeError, ValueError) as e:
+            raise ExpressionError(f"Comparison error: {e}")
+
+    return apply
+
+
+_COMPARE_FUNCS = {
+    op_type: _comparison_helper(op_type, fn) for op_type, fn in COMPARISON_OPS.items()
+}
+
+
+def _neg(operand):
+    try:
+        return op.neg(operand)
+    except (TypeError, ValueError) as e:
+        raise ExpressionError(f"Unary operation error: {e}")
+
+
+def _none_as_false(result):
+    return False if result is None else result
+
+
+def _call_value(root, *args):
+    if len(args) == 1 and isinstance(args[0], str):
+        return value(args[0], root)
+    if len(args) == 2 and isinstance(args[0], str):
+        return value(args[0], root, args[1])
+    raise ExpressionError("value() requires 'path' or ('path', default)")
+
+
+@lru_cache(maxsize=4096)
+def _path_getter(path: str) -> Callable[[Any], Any]:
+    """Build `root -> value(path, root)` for a literal path, unrolled per segment.
+
+    The generated body inlines the plain-dict case and defers everything else
+    to _step, so it returns exactly what value() would with default=None.
+    """
+    lines = ["def get(cur):"]
+    for part, last in _split_path(path):
+        lines.append("    if cur is None: return None")
+        lines.append(
+            f"    cur = cur.get({part!r}) if type(cur) is dict else _step(cur, {part!r}, {last})"
+        )
+    lines.append("    return cur")
+    namespace: Dict[str, Any] = {"__builtins__": {}, "dict": dict, "type": type, "_step": _step}
+    exec("\n".join(lines), namespace)
+    return namespace["get"]
+
+
+def _value_default(result, default):
+    return default if result is None else result
+
+
+def _resolve_helper(registry: DSLRegistry, func_name: str) -> Callable:
+    # Emitted as the callee, so a missing helper is reported before its
+    # arguments are evaluated, as in SafeEval
+    return registry.resolve(func_name)
+
+
+_ARITHMETIC_HELPERS = {op_type: f"_{op_type.__name__.lower()}" for op_type in ARITHMETIC_OPS}
+_COMPARISON_HELPERS = {op_type: f"_{op_type.__name__.lower()}" for op_type in COMPARISON_OPS}
+
+_SANDBOX_GLOBALS: Dict[str, Any] = {
+    "__builtins__": {},
+    "_neg": _neg,
+    "_none_as_false": _none_as_false,
+    "_call_value": _call_value,
+    "_value_default": _value_default,
+    "_resolve_helper": _resolve_helper,
+}
+for _op_type, _name in _ARITHMETIC_HELPERS.items():
+    _SANDBOX_GLOBALS[_name] = _arithmetic_helper(ARITHMETIC_OPS[_op_type])
+for _op_type, _name in _COMPARISON_HELPERS.items():
+    _SANDBOX_GLOBALS[_name] = _COMPARE_FUNCS[_op_type]
+
+
+def _check_tree(node: ast.AST, max_depth: int, depth: int = 1) -> None:
+    """Validate a whole expression tree against the DSL whitelist and depth limit.
+
+    Mirrors the checks of SafeEval, but eagerly: every node is visited, and the
+    walk stops as soon as it passes max_depth, so arbitrarily deep input never
+    reaches the recursive folding, lowering or compile() steps.
+    """
+    if depth > max_depth:
+        raise ResourceLimitError(f"Expression AST depth exceeds limit of {max_depth}")
+    if isinstance(node, ast.Expression):
+        children = [node.body]
+    elif isinstance(node, ast.Constant):
+        children = []
+    elif isinstance(node, ast.Name):
+        if node.id not in ("True", "False", "None"):
+            raise UnsupportedNodeError(f"Name not allowed: {node.id}")
+        children = []
+    elif isinstance(node, ast.BinOp):
+        if type(node.op) not in ARITHMETIC_OPS:
+            raise UnsupportedNodeError(f"Binary operator not allowed: {type(node.op).__name__}")
+        children = [node.left, node.right]
+    elif isinstance(node, ast.BoolOp):
+        children = node.values
+    elif isinstance(node, ast.UnaryOp):
+        if type(node.op) not in UNARY_OPS:
+            raise UnsupportedNodeError(f"Unary operator not allowed: {type(node.op).__name__}")
+        children = [node.operand]
+    elif isinstance(node, ast.Compare):
+        for op_node in node.ops:
+            if type(op_node) not in COMPARISON_OPS:
+                raise UnsupportedNodeError(
+                    f"Comparison operator not allowed: {type(op_node).__name__}"
+                )
+        children = [node.left, *node.comparators]
+    elif isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise UnsupportedNodeError("Only simple function calls allowed")
+        children = node.args
+    else:
+        raise UnsupportedNodeError(f"Node not allowed: {type(node).__name__}")
+
+    for child in children:
+        _check_tree(child, max_depth, depth + 1)
+
+
+_NONE_CHECKS = {ast.Eq: ast.Is, ast.NotEq: ast.IsNot}
+
+
+def _is_none_constant(node: ast.AST) -> bool:
+    return isinstance(node, ast.Constant) and node.value is None
+
+
+class _Lowering(ast.NodeTransformer):
+    """Rewrite a validated DSL tree into calls to the sandboxed helpers."""
+
+    def __init__(self, repeated_paths=frozenset()):
+        self._temp_count = 0
+        # Getters for literal value() paths, bound to the program as _g0, _g1, ...
+        self.getters: list = []
+        self._getter_index: Dict[str, int] = {}
+        # Paths used more than once are looked up once per evaluation into _v<i>
+        self._repeated_paths = repeated_paths
+        self.memoized: list = []
+
+    @staticmethod
+    def _helper(name: str, args) -> ast.Call:
+        return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=list(args), keywords=[])
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        return ast.Constant(value={"True": True, "False": False, "None": None}[node.id])
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        return self._helper(_ARITHMETIC_HELPERS[type(node.op)], [node.left, node.right])
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return node
+        return self._helper("_neg", [node.operand])
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        # Python's and/or already short-circuit and preserve operand values;
+        # only None has to be coerced to False where it could be returned.
+        self.generic_visit(node)
+        values = node.values
+        if isinstance(node.op, ast.And):
+            values = [self._helper("_none_as_false", [v]) for v in values]
+        else:
+            values = values[:-1] + [self._helper("_none_as_false", [values[-1]])]
+        return ast.BoolOp(op=node.op, values=values)
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        left = node.left
+        if len(node.ops) == 1 and type(node.ops[0]) in _NONE_CHECKS:
+            # `x == None` / `x != None` (missing-data checks) reduce to an identity
+            # test under the DSL's None semantics; no helper call needed
+            right = node.comparators[0]
+            if _is_none_constant(left):
+                left, right = right, left
+            if _is_none_constant(right):
+                return ast.Compare(
+                    left=left, ops=[_NONE_CHECKS[type(node.ops[0])]()], comparators=[right]
+                )
+        checks = []
+        last = len(node.ops) - 1
+        for i, (op_node, right) in enumerate(zip(node.ops, node.comparators)):
+            if i < last:
+                # Chained comparison: evaluate each middle operand exactly once
+                temp = f"_t{self._temp_count}"
+                self._temp_count += 1
+                right = ast.NamedExpr(target=ast.Name(id=temp, ctx=ast.Store()), value=right)
+                checks.append(self._helper(_COMPARISON_HELPERS[type(op_node)], [left, right]))
+                left = ast.Name(id=temp, ctx=ast.Load())
+            else:
+                checks.append(self._helper(_COMPARISON_HELPERS[type(op_node)], [left, right]))
+        if len(checks) == 1:
+            return checks[0]
+        return ast.BoolOp(op=ast.And(), values=checks)
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        node.args = [self.visit(a) for a in node.args]
+        root = ast.Name(id="_root", ctx=ast.Load())
+        if node.func.id == "value":
+            args = node.args
+            if (
+                len(args) in (1, 2)
+                and isinstance(args[0], ast.Constant)
+                and isinstance(args[0].value, str)
+            ):
+                # Literal path: resolve the segments now, not on every evaluation
+                path = args[0].value
+                index = self._getter_index.get(path)
+                if index is None:
+                    index = self._getter_index[path] = len(self.getters)
+                    self.getters.append(_path_getter(path))
+                    if path in self._repeated_paths:
+                        self.memoized.append(index)
+                if path in self._repeated_paths:
+                    lookup = ast.Name(id=f"_v{index}", ctx=ast.Load())
+                else:
+                    lookup = self._helper(f"_g{index}", [root])
+                if len(args) == 1:
+                    return lookup
+                return self._helper("_value_default", [lookup, args[1]])
+            return self._helper("_call_value", [root, *args])
+        registry = ast.Name(id="_registry", ctx=ast.Load())
+        callee = self._helper("_resolve_helper", [registry, ast.Constant(value=node.func.id)])
+        return ast.Call(func=callee, args=[root, *node.args], keywords=[])
+
+
+# Longest str/bytes a fold may produce; larger repetitions are left for runtime,
+# as CPython's own AST optimizer does, so unevaluated branches cost nothing
+_MAX_FOLDED_LEN = 4096
+
+
+def _bounded_fold(op_node: ast.operator, left: Any, right: Any) -> bool:
+    """Whether folding `left <op> right` has a small result."""
+    if isinstance(op_node, ast.Mult):
+        for seq, count in ((left, right), (right, left)):
+            if isinstance(seq, (str, bytes)) and isinstance(count, int):
+                return len(seq) * count <= _MAX_FOLDED_LEN
+    # %-formatting can pad to any width
+    return not (isinstance(op_node, ast.Mod) and isinstance(left, (str, bytes)))
+
+
+class _ConstantFolder(ast.NodeTransformer):
+    """Fold operators and min/max calls whose operands are all constants, bottom-up.
+
+    Folding goes through the sandbox helpers so results match evaluation
+    exactly; subtrees that raise (e.g. `1 / 0`, or an OverflowError) or
+    would build large sequences are left for runtime, where short-circuiting
+    may skip them.
+    """
+
+    @staticmethod
+    def _fold(node: ast.AST, fn: Callable, *operands) -> ast.AST:
+        try:
+            result = fn(*operands)
+        except Exception:
+            return node
+        return ast.copy_location(ast.Constant(value=result), node)
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.left, ast.Constant) and isinstance(node.right, ast.Constant):
+            left, right = node.left.value, node.right.value
+            if not _bounded_fold(node.op, left, right):
+                return node
+            helper = _SANDBOX_GLOBALS[_ARITHMETIC_HELPERS[type(node.op)]]
+            return self._fold(node, helper, left, right)
+        return node
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.operand, ast.Constant):
+            helper = op.not_ if isinstance(node.op, ast.Not) else _neg
+            return self._fold(node, helper, node.operand.value)
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        self.generic_visit(node)
+        # Built-ins (min/max) cannot be shadowed by a registry, so calls on
+        # constants can be evaluated now; user helpers may be impure
+        func = ALLOWED_FUNCS.get(node.func.id)
+        if func and not node.keywords and all(isinstance(a, ast.Constant) for a in node.args):
+            return self._fold(node, func, *(a.value for a in node.args))
+        return node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        operands = [node.left, *node.comparators]
+        if all(isinstance(o, ast.Constant) for o in operands):
+
+            def chain(*values):
+                for op_node, left, right in zip(node.ops, values, values[1:]):
+                    if not _COMPARE_FUNCS[type(op_node)](left, right):
+                        return False
+                return True
+
+            return self._fold(node, chain, *(o.value for o in operands))
+        return node
+
+
+def _repeated_literal_paths(tree: ast.AST) -> frozenset:
+    """Literal value() paths that occur more than once in an expression."""
+    seen = set()
+    repeated = set()
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "value"
+            and len(node.args) in (1, 2)
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            path = node.args[0].value
+            (repeated if path in seen else seen).add(path)
+    return frozenset(repeated)
+
+
+def _lambda_args(*names: str) -> ast.arguments:
+    return ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(arg=name) for name in names],
+        kwonlyargs=[],
+        kw_defaults=[],
+        defaults=[],
+    )
+
+
+def _interpreter(tree: ast.Expression, max_depth: int) -> Callable[[Any, DSLRegistry], Any]:
+    """Program that walks `tree` with SafeEval on each call."""
+
+    def run(root, registry):
+        ctx = {"value": lambda p, d=None: value(p, root, d), "root": root}
+        try:
+            return SafeEval(ctx, registry, max_depth).visit(tree)
+        except RecursionError:
+            raise ResourceLimitError("Expression nesting exceeds the interpreter's recursion limit")
+
+    return run
+
+
+@lru_cache(maxsize=1024)
+def _compile(
+    expr: str, max_depth: int = 25
+) -> Tuple[Callable[[Any, DSLRegistry], Any], Optional[ExpressionError]]:
+    """Parse and compile an expression; returns (program, validation_error).
+
+    When the whole tree passes the whitelist within max_depth, the program is
+    a `lambda _root, _registry: <lowered expr>`, so evaluation is an ordinary
+    function call with fast locals instead of an `eval` frame, and the error
+    is None. Otherwise the error is what the eager check hit, and the program
+    interprets the tree with SafeEval: as in the reference interpreter, an
+    invalid or too-deep node only raises if evaluation reaches it (so
+    `True or foo` is True, and call keywords are ignored).
+    """
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError as e:
+        raise ParseError(f"Expression syntax error: {e}")
+    except RecursionError:
+        raise ResourceLimitError("Expression nesting exceeds the parser's recursion limit")
+
+    try:
+        _check_tree(tree, max_depth)
+    except ExpressionError as e:
+        return _interpreter(tree, max_depth), e
+
+    tree = _ConstantFolder().visit(tree)
+    lowering = _Lowering(_repeated_literal_paths(tree))
+    body = lowering.visit(tree).body
+    if lowering.memoized:
+        # (_v0 := _g0(_root), ..., body)[-1]: each repeated path is resolved once
+        # up front (lookups are side-effect free) and shared by every use
+        lookups = [
+            ast.NamedExpr(
+                target=ast.Name(id=f"_v{i}", ctx=ast.Store()),
+                value=_Lowering._helper(f"_g{i}", [ast.Name(id="_root", ctx=ast.Load())]),
+            )
+            for i in lowering.memoized
+        ]
+        body = ast.Subscript(
+            value=ast.Tuple(elts=[*lookups, body], ctx=ast.Load()),
+            slice=ast.Constant(value=-1),
+            ctx=ast.Load(),
+        )
+    program = ast.Lambda(args=_lambda_args("_root", "_registry"), body=body)
+    # Close over the path getters: lambda _g0, ...: lambda _root, _registry: body
+    outer = ast.Lambda(
+        args=_lambda_args(*(f"_g{i}" for i in range(len(lowering.getters)))), body=program
+    )
+    tree = ast.fix_missing_locations(ast.Expression(body=outer))
+    factory = eval(compile(tree, "<dsl>", "eval"), _SANDBOX_GLOBALS)
+    return factory(*lowering.getters), None
+
 
 def eval_expr(
     expr: str,
@@ -365,6 +943,9 @@ def eval_expr(
 ) -> Any:
     """Evaluate a DSL expression safely against a root data structure.
 
+    The expression is validated and compiled once per unique string; repeated
+    evaluations only execute the cached code object.
+
     Args:
         expr: DSL expression string to evaluate
         root: Root data structure to evaluate against
@@ -386,11 +967,86 @@ def eval_expr(
     if len(expr) > max_length:
         raise ResourceLimitError(f"Expression length {len(expr)} exceeds limit of {max_length}")
 
-    # Parse with proper error handling
-    try:
-        tree = ast.parse(expr, mode="eval")
-    except SyntaxError as e:
-        raise ParseError(f"Expression syntax error: {e}")
+    program, _ = _compile(expr, max_depth)
+    return program(root, registry or _registry)
+
+
+def compile_expr(
+    expr: str,
+    registry: Optional[DSLRegistry] = None,
+    max_length: int = 1024,
+    max_depth: int = 25,
+) -> Callable[[Any], Any]:
+    """Compile a DSL expression into a reusable `root -> result` function.
+
+    Validation errors and resource limits are raised here rather than on each
+    call, which makes this the cheapest way to evaluate one expression against
+    many roots. The check is stricter than eval_expr: every node must be valid
+    and within max_depth, including branches short-circuiting would skip (so
+    `True or foo` is rejected here but evaluates to True with eval_expr).
+    Helpers are still looked up in the registry per call, so functions
+    registered later are picked up.
+
+    Args:
+        expr: DSL expression string to compile
+        registry: Optional registry for custom functions/accessors
+        max_length: Maximum allowed expression length in characters
+        max_depth: Maximum allowed AST depth
+
+    Returns:
+        Function evaluating the expression against a root data structure
+
+    Raises:
+        ResourceLimitError: If expression exceeds length or depth limits
+        ParseError: If expression has invalid syntax
+        UnsupportedNodeError: If expression contains disallowed operations
+    """
+    if len(expr) > max_length:
+        raise ResourceLimitError(f"Expression length {len(expr)} exceeds limit of {max_length}")
+
+    program, error = _compile(expr, max_depth)
+    if error is not None:
+        # Raise a fresh instance; the cached one would accumulate tracebacks
+        raise type(error)(*error.args)
+
+    registry = registry or _registry
+    return lambda root: program(root, registry)
+
+
+def eval_expr_batch(
+    expr: str,
+    roots: Iterable[Any],
+    registry: Optional[DSLRegistry] = None,
+    max_length: int = 1024,
+    max_depth: int = 25,
+) -> List[Any]:
+    """Evaluate one DSL expression against many roots.
+
+    Validation and limit checks happen once; each root then costs a single
+    call into the compiled program. Arguments and errors are as for eval_expr.
+
+    Returns:
+        One result per root, in order
+    """
+    if len(expr) > max_length:
+        raise ResourceLimitError(f"Expression length {len(expr)} exceeds limit of {max_length}")
+
+    program, _ = _compile(expr, max_depth)
+    registry = registry or _registry
+    return [program(root, registry) for root in roots]
+
+
+def _clear_compile_cache() -> None:
+    """Drop cached compiled expressions and path lookups."""
+    _compile.cache_clear()
+    _path_getter.cache_clear()
+    _split_path.cache_clear()
+
+
+def _compile_cache_info():
+    return _compile.cache_info()
+
 
-    ctx = {"value": lambda p, d=None: value(p, root, d), "root": root}
-    return SafeEval(ctx, registry, max_depth).visit(tree)
+# Parsing/compilation is cached per expression string; expose the cache controls
+eval_expr.cache_clear = _clear_compile_cache
+eval_expr.cache_info = _compile_cache_info
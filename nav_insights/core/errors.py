@@ -19,6 +19,18 @@ class CoreError(Exception):
         category: Optional legacy string category
     """
 
+    # Slots keep BaseException's instance __dict__ from being materialized
+    __slots__ = (
+        "message",
+        "error_code",
+        "_severity",
+        "_severity_str",
+        "context",
+        "original_error",
+        "code",
+        "category",
+    )
+
     def __init__(
         self,
         message: str = None,
@@ -45,21 +57,36 @@ class CoreError(Exception):
         self.code = code
         self.category = category
 
+    @property
+    def severity(self) -> Severity | str:
+        return self._severity
+
+    @severity.setter
+    def severity(self, severity: Severity | str) -> None:
+        # Resolve the serialized form once rather than on every to_dict()
+        self._severity = severity
+        self._severity_str = severity.value if isinstance(severity, Enum) else str(severity)
+
+    def __reduce__(self):
+        # BaseException pickles only args + __dict__; carry the slots explicitly
+        state = {name: getattr(self, name) for name in CoreError.__slots__}
+        if getattr(self, "__dict__", None):
+            state.update(self.__dict__)
+        return (_rebuild_error, (type(self), self.args), state)
+
     def to_dict(self) -> Dict[str, Any]:
         data = {
             "error_code": self.error_code.name,
-            "severity": self.severity.value
-            if hasattr(self.severity, "value")
-            else str(self.severity),
+            "severity": self._severity_str,
             "message": self.message,
             "context": self.context,
         }
         if self.original_error is not None:
             data["original_error"] = type(self.original_error).__name__
         # Include legacy keys if present
-        if getattr(self, "code", None) is not None:
+        if self.code is not None:
             data["code"] = self.code
-        if getattr(self, "category", None) is not None:
+        if self.category is not None:
             data["category"] = self.category
         return data
 
@@ -70,6 +97,13 @@ class CoreError(Exception):
         return base
 
 
+def _rebuild_error(cls: Type[CoreError], args: tuple) -> CoreError:
+    # Subclass __init__ signatures differ, so unpickling bypasses them
+    err = Exception.__new__(cls)
+    err.args = args
+    return err
+
+
 # Mapping of known exceptions to CoreError codes/categories
 _DSL_EXCEPTION_MAP: Dict[Type[BaseException], Dict[str, str]] = {
     dslx.ParseError: {"code": "parse_error", "category": "dsl"},
@@ -78,6 +112,7 @@ _DSL_EXCEPTION_MAP: Dict[Type[BaseException], Dict[str, str]] = {
     dslx.ResourceLimitError: {"code": "resource_limit", "category": "dsl"},
     dslx.ExpressionError: {"code": "expression_error", "category": "dsl"},
 }
+_DSL_TYPES = tuple(_DSL_EXCEPTION_MAP)
 
 
 class ErrorCode(str, Enum):
@@ -90,6 +125,8 @@ class ErrorCode(str, Enum):
 
 
 class ValidationError(CoreError):
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -100,11 +137,14 @@ class ValidationError(CoreError):
         original_error: Optional[BaseException] = None,
         error_code: Optional[ErrorCode] = None,
     ) -> None:
-        ctx = context.copy() if context else {}
-        if field_name is not None:
-            ctx["field_name"] = field_name
-        if field_value is not None:
-            ctx["field_value"] = field_value
+        # Copy only when adding keys; CoreError supplies its own empty dict
+        ctx = context
+        if field_name is not None or field_value is not None:
+            ctx = context.copy() if context else {}
+            if field_name is not None:
+                ctx["field_name"] = field_name
+            if field_value is not None:
+                ctx["field_value"] = field_value
         super().__init__(
             message=message,
             error_code=error_code or ErrorCode.INVALID_FIELD_VALUE,
@@ -115,6 +155,8 @@ class ValidationError(CoreError):
 
 
 class NegativeMetricError(CoreError):
+    __slots__ = ()
+
     def __init__(
         self, field_name: str, field_value: Any, *, context: Optional[Dict[str, Any]] = None
     ) -> None:
@@ -129,6 +171,8 @@ class NegativeMetricError(CoreError):
 
 
 class ParserError(CoreError):
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
@@ -136,8 +180,9 @@ class ParserError(CoreError):
         parser_name: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
     ) -> None:
-        ctx = context.copy() if context else {}
+        ctx = context
         if parser_name:
+            ctx = context.copy() if context else {}
             ctx["parser_name"] = parser_name
         super().__init__(
             message=message,
@@ -153,27 +198,25 @@ def to_core_error(exc: BaseException, *, default_category: str = "unknown") -> C
     Known DSL exceptions are mapped to stable codes; otherwise falls back to
     a generic 'unhandled_exception' code with provided default_category.
     """
-    for etype, meta in _DSL_EXCEPTION_MAP.items():
-        if isinstance(exc, etype):
-            # Map DSL exceptions to CoreError with legacy code/category preserved
-            ce = CoreError(
-                message=str(exc),
-                error_code=ErrorCode.UNKNOWN_ERROR,
-                severity=Severity.high,
-                context={},
-                original_error=exc,
-                code=meta["code"],
-                category=meta["category"],
-            )
-            return ce
+    # Exact type first; subclasses resolve to their nearest mapped base
+    meta = _DSL_EXCEPTION_MAP.get(type(exc))
+    if meta is None and isinstance(exc, _DSL_TYPES):
+        for cls in type(exc).__mro__[1:]:
+            meta = _DSL_EXCEPTION_MAP.get(cls)
+            if meta is not None:
+                break
+    if meta is not None:
+        # Map DSL exceptions to CoreError with legacy code/category preserved
+        code, category = meta["code"], meta["category"]
+    else:
+        code, category = "unhandled_exception", default_category
     return CoreError(
         message=str(exc),
         error_code=ErrorCode.UNKNOWN_ERROR,
         severity=Severity.high,
-        context={},
         original_error=exc,
-        code="unhandled_exception",
-        category=default_category,
+        code=code,
+        category=category,
     )
 
 
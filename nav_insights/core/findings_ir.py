@@ -22,13 +22,15 @@ Pydantic v2 compatible with v1 fallback for JSON schema export.
 """
 
 from __future__ import annotations
+import copy
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache, partial
 from typing import Any, Dict, List, Optional
 import os
 
-from pydantic import BaseModel, Field, condecimal, confloat, model_validator
+from pydantic import BaseModel, ConfigDict, Field, condecimal, confloat, model_validator
 
 # ---------- Core scalar types ----------
 USD = condecimal(
@@ -37,6 +39,8 @@ USD = condecimal(
 Rate01 = condecimal(ge=0, le=1, max_digits=6, decimal_places=5)  # probabilities/ratios in [0,1]
 Pct01 = Rate01  # alias for clarity
 
+_utcnow = partial(datetime.now, timezone.utc)
+
 # Default currency - configurable via environment variable
 DEFAULT_CURRENCY = os.getenv("NAV_INSIGHTS_DEFAULT_CURRENCY", "USD")
 
@@ -45,6 +49,8 @@ DEFAULT_CURRENCY = os.getenv("NAV_INSIGHTS_DEFAULT_CURRENCY", "USD")
 class Money(BaseModel):
     """Money type with amount and currency code, preserving Decimal precision"""
 
+    model_config = ConfigDict(frozen=True)
+
     amount: condecimal(max_digits=18, decimal_places=4) = Decimal("0")
     currency: str = Field(
         default=DEFAULT_CURRENCY,
@@ -74,6 +80,8 @@ class EntityType(str, Enum):
 
 
 class EntityRef(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     type: EntityType
     id: str = Field(..., description="Provider/native id or stable synthetic key")
     name: Optional[str] = None
@@ -82,6 +90,8 @@ class EntityRef(BaseModel):
 
 # ---------- Evidence & provenance ----------
 class Evidence(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     source: str = Field(..., description='e.g., "google_ads.query" or "ga4.export"')
     query: Optional[str] = Field(None, description="SQL/GAQL/API filter; optional if sensitive")
     rows: Optional[int] = Field(None, description="Row count contributing to this metric/finding")
@@ -143,6 +153,15 @@ class Finding(BaseModel):
     evidence: List[Evidence] = Field(default_factory=list)
     provenance: Optional[AnalyzerProvenance] = None
 
+    @classmethod
+    def build(cls, **data: Any) -> "Finding":
+        """Construct without validation, for trusted internal callers.
+
+        Fields must already have their final types (enums, Decimal metrics,
+        EntityRef/Evidence instances); use Finding(...) for external data.
+        """
+        return cls.model_construct(**data)
+
 
 # ---------- Totals & aggregates ----------
 class AccountMeta(BaseModel):
@@ -187,7 +206,7 @@ class Aggregates(BaseModel):
 # ---------- The IR root ----------
 class AuditFindings(BaseModel):
     schema_version: str = "1.0.0"
-    generated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    generated_at: datetime = Field(default_factory=_utcnow)
 
     account: AccountMeta
     date_range: DateRange
@@ -232,8 +251,8 @@ class AuditFindings(BaseModel):
 
 
 # ---------- JSON Schema export utilities ----------
-def get_model_json_schema(model_class: type[BaseModel]) -> Dict[str, Any]:
-    """Export JSON Schema for a Pydantic model (v2 compatible with v1 fallback)"""
+@lru_cache(maxsize=None)
+def _cached_model_json_schema(model_class: type[BaseModel]) -> Dict[str, Any]:
     try:
         # Pydantic v2
         return model_class.model_json_schema()
@@ -242,6 +261,14 @@ def get_model_json_schema(model_class: type[BaseModel]) -> Dict[str, Any]:
         return model_class.schema()
 
 
+def get_model_json_schema(model_class: type[BaseModel]) -> Dict[str, Any]:
+    """Export JSON Schema for a Pydantic model (v2 compatible with v1 fallback)
+
+    Schemas are generated once per class; each caller gets its own copy.
+    """
+    return copy.deepcopy(_cached_model_json_schema(model_class))
+
+
 def export_all_schemas() -> Dict[str, Dict[str, Any]]:
     """Export JSON schemas for all core IR models"""
     models = {
@@ -1,12 +1,17 @@
 from __future__ import annotations
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 import ast
+import copy
+import os
 from functools import lru_cache
 import yaml
-from jinja2 import Template
-from .dsl import eval_expr, value, register_dsl_function
+from jinja2 import Environment, Template, TemplateSyntaxError, meta
+from .dsl import ExpressionError, compile_expr, eval_expr, value, register_dsl_function
 from .actions import Action, ActionImpact
 
+# LibYAML's C loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # Register domain-specific helper functions for use in DSL expressions
 def _register_helpers():
@@ -34,39 +39,85 @@ def _register_helpers():
 _register_helpers()
 
 
-def _render(template_str: str, ctx: Dict[str, Any]) -> str:
-    def pct(x):
-        try:
-            return f"{float(x) * 100:.0f}%"
-        except Exception:
-            return "n/a"
+def _pct(x):
+    try:
+        return f"{float(x) * 100:.0f}%"
+    except Exception:
+        return "n/a"
+
+
+def _usd(x):
+    try:
+        return f"${float(x):,.0f}"
+    except Exception:
+        return "n/a"
+
+
+# One environment for all justification templates; helpers are globals so
+# each render only passes the per-IR names
+_JINJA_ENV = Environment(autoescape=False)
+_JINJA_ENV.globals.update(pct=_pct, usd=_usd)
 
-    def usd(x):
-        try:
-            return f"${float(x):,.0f}"
-        except Exception:
-            return "n/a"
+
+@lru_cache(maxsize=256)
+def _template(template_str: str) -> Template:
+    """Compile a template once; rules reuse the same handful of strings."""
+    return _JINJA_ENV.from_string(template_str)
+
+
+def _render(template_str: str, ctx: Dict[str, Any]) -> str:
+    root = ctx["root"]
 
     def value_fn(path: str, default=None):
-        return value(path, ctx["root"], default)
+        return value(path, root, default)
 
-    env = {"pct": pct, "usd": usd, "value": value_fn, "action": ctx.get("action", {})}
-    return Template(template_str).render(**env)
+    return _template(template_str).render(value=value_fn, action=ctx.get("action", {}))
 
 
-def _eval_value_or_expr(node: Any, root: Any):
+def _compile_value_or_expr(node: Any) -> Callable[[Any], Any]:
+    """Compile a literal/expression tree (e.g. expected_impact) into `root -> value`.
+
+    Strings are DSL expressions when they compile and evaluate, and literals
+    otherwise (e.g. risk: "low"); expressions that cannot compile are resolved
+    to their literal here, once.
+    """
     if isinstance(node, (int, float, bool)) or node is None:
-        return node
+        return lambda root: node
     if isinstance(node, dict):
-        return {k: _eval_value_or_expr(v, root) for k, v in node.items()}
+        items = [(k, _compile_value_or_expr(v)) for k, v in node.items()]
+        return lambda root: {k: fn(root) for k, fn in items}
     if isinstance(node, str):
         try:
-            return eval_expr(node, root)
+            fn = compile_expr(node)
         except Exception:
-            return node
+            return lambda root: node
+
+        def evaluate(root):
+            try:
+                return fn(root)
+            except Exception:
+                return node
+
+        return evaluate
+    if isinstance(node, list):
+        fns = [_compile_value_or_expr(v) for v in node]
+        return lambda root: [fn(root) for fn in fns]
+    return lambda root: node
+
+
+def _is_static(node: Any) -> bool:
+    """True when a literal/expression tree contains no DSL expressions."""
+    if isinstance(node, dict):
+        return all(_is_static(v) for v in node.values())
     if isinstance(node, list):
-        return [_eval_value_or_expr(v, root) for v in node]
-    return node
+        return all(_is_static(v) for v in node)
+    if isinstance(node, str):
+        try:
+            compile_expr(node)
+        except Exception:
+            return True
+        return False
+    return True
 
 
 def _validate_ruleset(rules: List[Dict[str, Any]]) -> None:
@@ -104,51 +155,183 @@ def _validate_ruleset(rules: List[Dict[str, Any]]) -> None:
         _walk(r.get("expected_impact", {}))
 
 
-@lru_cache(maxsize=32)
-def _load_rules_cached(rules_path: str) -> List[Dict[str, Any]]:
+def _action_fields(r: Dict[str, Any]) -> Dict[str, Any]:
+    """A rule's static Action fields, as written in the rule."""
+    action_def = r.get("action", {})
+    return {
+        "type": action_def.get("type", "other"),
+        "target": action_def.get("target", ""),
+        "params": action_def.get("params", {}),
+        "priority": r.get("priority", 3),
+        "confidence": 0.9,
+        "source_rule_id": r.get("id"),
+    }
+
+
+def _action_template(r: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Validate a rule's static action fields once and return the coerced values.
+
+    Only id, justification and expected_impact vary per evaluation, so the
+    engine can build Actions with model_construct instead of re-validating.
+    Returns None if the fields are invalid; those rules keep validating (and
+    failing) each time they fire, so a bad action in a rule that never fires
+    does not break the ruleset.
+    """
+    fields = _action_fields(r)
+    try:
+        template = Action(id=str(r["id"]), justification="", **fields)
+    except ValueError:
+        return None
+    return {name: getattr(template, name) for name in fields}
+
+
+def _load_rules(rules_path: str) -> List[Dict[str, Any]]:
     with open(rules_path, "r", encoding="utf-8") as f:
-        rules = yaml.safe_load(f) or []
+        rules = yaml.load(f, Loader=_YamlLoader) or []
     _validate_ruleset(rules)
     return rules
 
 
-def clear_rule_cache() -> None:
-    _load_rules_cached.cache_clear()
+def _compile_condition(expr: str) -> Callable[[Any], Any]:
+    """Return `root -> result` for a condition expression.
 
+    Expressions that cannot be compiled up front (or exceed eval_expr's default
+    limits) defer to eval_expr so the error surfaces only if the rule is reached.
+    """
+    try:
+        return compile_expr(expr)
+    except ExpressionError:
+        return lambda root: eval_expr(expr, root)
 
-def evaluate_rules(ir: Any, rules_path: str) -> List[Action]:
-    rules = _load_rules_cached(rules_path)
 
-    actions: List[Action] = []
-    for r in rules:
-        conds = r.get("if_all", [])
-        if not all(bool(eval_expr(c["expr"], ir)) for c in conds):
-            continue
-
-        action_def = r.get("action", {})
-        action = {
-            "id": f"{r.get('id')}_ACT_{len(actions) + 1}",
-            "type": action_def.get("type", "other"),
-            "target": action_def.get("target", ""),
-            "params": action_def.get("params", {}),
-            "priority": r.get("priority", 3),
-            "confidence": 0.9,
-            "source_rule_id": r.get("id"),
-        }
-        ctx = {"root": ir, "action": action}
-        just_tpl = r.get("justification_template", "")
-        justification = _render(just_tpl, ctx) if just_tpl else r.get("description", "")
-        exp_imp_raw = r.get("expected_impact", {})
-        exp_imp = _eval_value_or_expr(exp_imp_raw, ir)
-        impact = None
-        if exp_imp:
-            impact = ActionImpact(**exp_imp)
-
-        actions.append(
-            Action(
-                justification=justification.strip(),
-                expected_impact=impact,
-                **action,
-            )
+_NO_STATIC_IMPACT = object()
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def _make_emitter(r: Dict[str, Any]) -> Callable[[Any, int], Action]:
+    """Build `(root, index) -> Action` for a triggered rule."""
+    action_fields = _action_template(r)
+    build = Action.model_construct
+    if action_fields is None:
+        action_fields = _action_fields(r)
+        build = Action
+    rule_id = r.get("id")
+    just_tpl = r.get("justification_template", "")
+    impact_def = r.get("expected_impact", {})
+    expected_impact = _compile_value_or_expr(impact_def)
+
+    # A literal impact is the same on every fire; ActionImpact is frozen, so
+    # one validated instance can be shared. Invalid ones still fail per fire.
+    static_impact = _NO_STATIC_IMPACT
+    if isinstance(impact_def, dict) and _is_static(impact_def):
+        try:
+            static_impact = ActionImpact(**impact_def) if impact_def else None
+        except ValueError:
+            pass
+
+    # Plain-text templates (and the description fallback) need no rendering
+    static_justification = None
+    if not just_tpl:
+        static_justification = r.get("description", "").strip()
+    elif not any(tag in just_tpl for tag in ("{{", "{%", "{#")):
+        static_justification = just_tpl.strip()
+
+    # Only templates that mention `action` get a per-fire dict of its fields
+    try:
+        needs_action = "action" in meta.find_undeclared_variables(_JINJA_ENV.parse(just_tpl))
+    except TemplateSyntaxError:
+        needs_action = True  # let _render raise it if the rule ever fires
+    a_type, target, params = action_fields["type"], action_fields["target"], action_fields["params"]
+    priority, confidence = action_fields["priority"], action_fields["confidence"]
+    source_rule_id = action_fields["source_rule_id"]
+    # Each Action gets its own params; nested values are copied so emitted
+    # Actions share nothing with each other or the cached rule
+    flat_params = isinstance(params, dict) and all(type(v) in _SCALARS for v in params.values())
+
+    def emit(root: Any, index: int) -> Action:
+        action_id = f"{rule_id}_ACT_{index}"
+        action_params = dict(params) if flat_params else copy.deepcopy(params)
+        justification = static_justification
+        if justification is None:
+            action = {}
+            if needs_action:
+                action = {"id": action_id, **action_fields, "params": action_params}
+            justification = _render(just_tpl, {"root": root, "action": action}).strip()
+        impact = static_impact
+        if impact is _NO_STATIC_IMPACT:
+            exp_imp = expected_impact(root)
+            impact = None
+            if exp_imp:
+                # Impact values come from the IR, so they still go through validation
+                impact = ActionImpact(**exp_imp)
+
+        # Static fields were validated at load time unless _action_template
+        # rejected them, in which case this validates (and raises) per fire
+        return build(
+            id=action_id,
+            type=a_type,
+            target=target,
+            params=action_params,
+            justification=justification,
+            expected_impact=impact,
+            priority=priority,
+            confidence=confidence,
+            source_rule_id=source_rule_id,
         )
-    return actions
+
+    return emit
+
+
+@lru_cache(maxsize=32)
+def _compile_rules_cached(
+    rules_path: str, mtime_ns: Optional[int]
+) -> Callable[[Any], List[Action]]:
+    rules = _load_rules(rules_path)
+
+    # Generated source only references names bound in `namespace`; rule text
+    # (expressions, ids, templates) never becomes Python source.
+    namespace: Dict[str, Any] = {"__builtins__": {}, "len": len}
+    lines = ["def run(root):", "    actions = []", "    append = actions.append"]
+    for i, r in enumerate(rules):
+        checks = []
+        for j, c in enumerate(r.get("if_all", [])):
+            name = f"_c{i}_{j}"
+            namespace[name] = _compile_condition(c["expr"])
+            checks.append(f"{name}(root)")
+        namespace[f"_emit{i}"] = _make_emitter(r)
+        lines.append(f"    if {' and '.join(checks) or 'True'}:")
+        lines.append(f"        append(_emit{i}(root, len(actions) + 1))")
+    lines.append("    return actions")
+    exec(compile("\n".join(lines), f"<rules {rules_path}>", "exec"), namespace)
+    return namespace["run"]
+
+
+# rules path -> mtime of its last successful stat, for compile_rules
+_LAST_MTIME: Dict[str, int] = {}
+
+
+def compile_rules(rules_path: str) -> Callable[[Any], List[Action]]:
+    """Compile a rules YAML file into a single `ir -> List[Action]` function.
+
+    All rule conditions are compiled once and chained into one generated
+    function, so evaluating an IR is straight-line code with no per-rule
+    interpretation. Results are cached until the file's mtime changes; if the
+    file can no longer be stat'ed, the last compile of it keeps being used.
+    """
+    try:
+        mtime_ns = os.stat(rules_path).st_mtime_ns
+    except OSError:
+        mtime_ns = _LAST_MTIME.get(rules_path)
+    else:
+        _LAST_MTIME[rules_path] = mtime_ns
+    return _compile_rules_cached(rules_path, mtime_ns)
+
+
+def clear_rule_cache() -> None:
+    _compile_rules_cached.cache_clear()
+    _LAST_MTIME.clear()
+    _template.cache_clear()
+
+
+def evaluate_rules(ir: Any, rules_path: str) -> List[Action]:
+    return compile_rules(rules_path)(ir)
@@ -9,7 +9,9 @@ This module provides shared utilities for all parsers and analyzers:
 from __future__ import annotations
 import hashlib
 import decimal
+import re
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from .ir_base import Severity
@@ -39,8 +41,15 @@ def map_priority_level(level: Any) -> Severity:
     """
     if level is None:
         return Severity.low
+    if type(level) is str:
+        return _map_priority_str(level)
+    return _map_priority_str.__wrapped__(str(level))
 
-    level_str = str(level).lower().strip()
+
+@lru_cache(maxsize=64)
+def _map_priority_str(level: str) -> Severity:
+    # Analyzer payloads repeat a handful of spellings ("HIGH", "medium", ...)
+    level_str = level.lower().strip()
 
     if level_str in ("critical", "high"):
         return Severity.high
@@ -82,13 +91,15 @@ def generate_finding_id(base_id: str, *entity_parts: str) -> str:
             field_value=base_id,
         )
 
+    parts = [str(part) for part in (base_id, *entity_parts)]
+
     # Sanitize and combine all parts
-    sanitized_parts = [_sanitize_id_part(str(part)) for part in [base_id] + list(entity_parts)]
+    sanitized_parts = [_sanitize_id_part(part) for part in parts]
     combined = "_".join(part for part in sanitized_parts if part)
 
-    # Create deterministic hash from all parts
-    hash_input = "|".join(str(part) for part in [base_id] + list(entity_parts))
-    hash_suffix = hashlib.sha256(hash_input.encode("utf-8")).hexdigest()[:8]
+    # Create deterministic hash from all parts. The algorithm is part of the
+    # ID contract: changing it would change every previously issued ID.
+    hash_suffix = hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:8]
 
     return f"{combined}_{hash_suffix}"
 
@@ -98,14 +109,46 @@ def _sanitize_id_part(part: str) -> str:
     if not part:
         return ""
 
-    # Replace problematic characters with underscores
-    sanitized = "".join(char if char.isalnum() else "_" for char in part.upper())
+    upper = part.upper()
+    if upper.isascii():
+        # Replace each run of problematic characters with a single underscore
+        return _NON_ALNUM_RUN.sub("_", upper).strip("_")
+
+    # isalnum() is Unicode-aware, so non-ASCII letters/digits are kept
+    sanitized = "".join(char if char.isalnum() else "_" for char in upper)
+    return _UNDERSCORE_RUN.sub("_", sanitized).strip("_")
+
+
+_NON_ALNUM_RUN = re.compile(r"[^A-Za-z0-9]+")
+_UNDERSCORE_RUN = re.compile(r"__+")
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _cached_decimal(value: Any) -> Decimal:
+    return Decimal(value if type(value) is str else str(value))
 
-    # Remove consecutive underscores and trim
-    while "__" in sanitized:
-        sanitized = sanitized.replace("__", "_")
 
-    return sanitized.strip("_")
+def to_decimal(value: Any) -> Decimal:
+    """Convert a metric value to Decimal, memoizing repeated inputs.
+
+    Equivalent to ``Decimal(str(value))``. Analyzer payloads repeat the same
+    small counts and prices many times, so parsed results are cached per
+    (type, value); unhashable inputs, Decimals and signed zero floats are
+    converted directly since their cache keys would not be exact.
+
+    Raises:
+        decimal.InvalidOperation: If the value is not a valid numeral
+    """
+    kind = type(value)
+    if kind is Decimal:
+        return value
+    if kind is float and value == 0:
+        # 0.0 and -0.0 hash equal but convert to different Decimals
+        return Decimal(str(value))
+    try:
+        return _cached_decimal(value)
+    except TypeError:
+        return Decimal(str(value))
 
 
 def validate_non_negative_metrics(
@@ -129,15 +172,15 @@ def validate_non_negative_metrics(
 
     Raises:
         NegativeMetricError: If any specified metric is negative
-        ValidationError: If metric conversion fails
+        ValidationError: If metric conversion fails or yields NaN/Infinity
     """
     validated_metrics: Dict[str, Decimal] = {}
+    if not metrics:
+        return validated_metrics
 
     for metric_name in metric_names:
-        if metric_name not in metrics:
-            continue
-
-        value = metrics[metric_name]
+        # One lookup per name; absent metrics read as None and are skipped
+        value = metrics.get(metric_name)
 
         # Skip None values or "N/A" strings
         if value is None or value == "N/A":
@@ -145,7 +188,7 @@ def validate_non_negative_metrics(
 
         # Convert to Decimal
         try:
-            decimal_value = Decimal(str(value))
+            decimal_value = to_decimal(value)
         except (ValueError, TypeError, decimal.InvalidOperation) as e:
             raise ValidationError(
                 f"Cannot convert metric '{metric_name}' to decimal: {value}",
@@ -155,6 +198,15 @@ def validate_non_negative_metrics(
                 original_error=e,
             )
 
+        # NaN/Infinity are never valid IR metrics (and NaN cannot be compared)
+        if not decimal_value.is_finite():
+            raise ValidationError(
+                f"Metric '{metric_name}' must be a finite number: {value}",
+                field_name=metric_name,
+                field_value=value,
+                context={"parser_name": parser_name},
+            )
+
         # Check for negative values
         if decimal_value < 0:
             raise NegativeMetricError(
@@ -182,13 +234,14 @@ def safe_decimal_conversion(
         Decimal: Converted value or default
 
     Raises:
-        ValidationError: If conversion fails for non-None, non-"N/A" values
+        ValidationError: If conversion fails for non-None, non-"N/A" values, or
+            yields NaN/Infinity
     """
     if value is None or value == "N/A":
         return default
 
     try:
-        return Decimal(str(value))
+        result = to_decimal(value)
     except (ValueError, TypeError, decimal.InvalidOperation) as e:
         raise ValidationError(
             f"Cannot convert '{field_name}' to decimal: {value}",
@@ -196,6 +249,13 @@ def safe_decimal_conversion(
             field_value=value,
             original_error=e,
         )
+    if not result.is_finite():
+        raise ValidationError(
+            f"'{field_name}' must be a finite number: {value}",
+            field_name=field_name,
+            field_value=value,
+        )
+    return result
 
 
 def validate_required_fields(
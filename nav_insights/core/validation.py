@@ -7,7 +7,8 @@ T = TypeVar("T", bound=BaseModel)
 
 
 def to_minified_json(model: BaseModel) -> str:
-    return model.model_dump_json(exclude_none=True, separators=(",", ":"))
+    # pydantic-core already emits compact JSON (and rejects json.dumps-style kwargs)
+    return model.model_dump_json(exclude_none=True)
 
 
 def schema_json(model_cls: Type[T]) -> str:
@@ -1,15 +1,43 @@
 from __future__ import annotations
 import json
+import threading
 import time
-from typing import Any, Dict, List, Optional, Sequence, Type, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-import requests
-from requests import Session
 from pydantic import BaseModel, ValidationError
 
+from .findings_ir import get_model_json_schema
+
+if TYPE_CHECKING:
+    from requests import Session
+
 T = TypeVar("T", bound=BaseModel)
 
 
+def _dumps(obj: Any) -> str:
+    """Compact JSON for prompts; unknown types via str()."""
+    return json.dumps(obj, default=str, separators=(",", ":"))
+
+
+@lru_cache(maxsize=32)
+def _schema_json(schema_model: Type[BaseModel]) -> str:
+    return json.dumps(get_model_json_schema(schema_model))
+
+
 class LlamaCppClient:
     def __init__(
         self,
@@ -21,7 +49,18 @@ class LlamaCppClient:
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.timeout = timeout
-        self.session = session or requests.Session()
+        if session is None:
+            # Imported here so the module (and callers passing their own client)
+            # works without requests installed
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            # Batched calls to the same server share pooled keep-alive sockets
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
 
     def _chat(
         self,
@@ -58,10 +97,7 @@ class LlamaCppClient:
             {"role": "system", "content": system_prompt.strip()},
             {"role": "user", "content": user_prompt.strip()},
         ]
-        if hasattr(schema_model, "model_json_schema"):
-            json_schema = schema_model.model_json_schema()
-        else:
-            json_schema = schema_model.schema()  # type: ignore
+        json_schema = get_model_json_schema(schema_model)
 
         if try_json_schema_mode:
             try:
@@ -80,7 +116,7 @@ class LlamaCppClient:
                 "role": "system",
                 "content": (
                     "Return ONLY MINIFIED JSON that validates the provided schema. No prose.\n"
-                    + json.dumps(json_schema)
+                    + _schema_json(schema_model)
                 ),
             },
             {"role": "user", "content": user_prompt.strip()},
@@ -111,6 +147,50 @@ class LlamaCppClient:
         return schema_model.parse_obj(data)  # pydantic v1
 
 
+# Most idle clients kept per endpoint; extra ones are closed when returned
+_MAX_IDLE_CLIENTS = 32
+
+# (base_url, model, timeout) -> idle clients, each with its own pooled Session
+_idle_clients: Dict[Tuple[str, str, int], List[LlamaCppClient]] = {}
+_idle_lock = threading.Lock()
+
+
+@contextmanager
+def _pooled_client(base_url: str, model: str, timeout: int) -> Iterator[LlamaCppClient]:
+    """Check a client out of the process-wide pool for one call.
+
+    requests.Session is not documented as thread-safe, so a client is only
+    ever used by one call at a time; returning it afterwards lets later calls
+    (from any thread or batch) reuse its keep-alive connections instead of
+    leaving a Session behind per worker thread.
+    """
+    key = (base_url, model, timeout)
+    with _idle_lock:
+        idle = _idle_clients.get(key)
+        client = idle.pop() if idle else None
+    if client is None:
+        client = LlamaCppClient(base_url=base_url, model=model, timeout=timeout)
+    try:
+        yield client
+    finally:
+        with _idle_lock:
+            idle = _idle_clients.setdefault(key, [])
+            if len(idle) < _MAX_IDLE_CLIENTS:
+                idle.append(client)
+                client = None
+        if client is not None:
+            client.session.close()
+
+
+def close_clients() -> None:
+    """Close the pooled clients' sessions (e.g. at shutdown or in tests)."""
+    with _idle_lock:
+        clients = [client for idle in _idle_clients.values() for client in idle]
+        _idle_clients.clear()
+    for client in clients:
+        client.session.close()
+
+
 def compose_insight_json(
     ir: Any,
     actions: List[Any],
@@ -118,13 +198,46 @@ def compose_insight_json(
     base_url: str = "http://localhost:8000/v1",
     model: str = "local",
     timeout: Optional[int] = None,
+    client: Optional[LlamaCppClient] = None,
 ) -> T:
-    client = LlamaCppClient(base_url=base_url, model=model, timeout=timeout or 120)
+    if client is None:
+        with _pooled_client(base_url, model, timeout or 120) as client:
+            return compose_insight_json(ir, actions, schema_model, client=client)
     system = "You produce ONLY MINIFIED JSON that validates the provided schema."
     user = (
         "Given these facts and actions, produce the final Insight JSON.\nFacts:\n"
-        + json.dumps(ir, default=str)
+        + _dumps(ir)
         + "\nActions:\n"
-        + json.dumps([a.model_dump() for a in actions], default=str)
+        # Each action serializes straight to JSON in pydantic-core
+        + "["
+        + ",".join(a.model_dump_json() for a in actions)
+        + "]"
     )
     return client.generate_structured(schema_model, system, user)
+
+
+def compose_insight_json_batch(
+    cases: Sequence[Tuple[Any, List[Any]]],
+    schema_model: Type[T],
+    base_url: str = "http://localhost:8000/v1",
+    model: str = "local",
+    timeout: Optional[int] = None,
+    max_workers: int = 8,
+) -> List[T]:
+    """compose_insight_json over many (ir, actions) cases with requests in flight concurrently.
+
+    Each call mostly waits on the model server, so a thread pool overlaps that
+    latency (useful when the server decodes in parallel). Each case checks a
+    client out of the shared pool, so connections are reused across cases and
+    batches without two threads sharing a Session. Results are returned in
+    input order; the first failure raises.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(cases)))) as ex:
+        return list(
+            ex.map(
+                lambda case: compose_insight_json(
+                    case[0], case[1], schema_model, base_url, model, timeout
+                ),
+                cases,
+            )
+        )
@@ -18,7 +18,8 @@ Outputs:
       }
 
 Notes:
-  - No external deps; does not import pydantic. We keep the format flexible.
+  - No required deps (orjson is used when installed); does not import pydantic.
+    We keep the format flexible.
   - If label_insight.json is missing, a *synthetic* minimal Insight is generated
     (valid JSON shape but simple text). Replace with real labels when available.
 """
@@ -28,17 +29,70 @@ import json
 import os
 import random
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+try:  # optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+_WRITE_BLOCK_BYTES = 4 << 20
+
 
 def read_json(path: Path) -> Any:
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
 
 
+_PLAIN_SCALARS = frozenset({str, int, bool, type(None)})
+
+
+def _orjson_exact(obj: Any) -> bool:
+    """Whether orjson would encode `obj` exactly like the stdlib encoder.
+
+    True for plain JSON data whose floats are finite and in the range Python
+    writes without an exponent. orjson writes NaN/Infinity as null and
+    formats exponents differently (1e16 vs 1e+16), and encodes types such as
+    datetimes that json.dumps rejects. Non-str keys and ints beyond 64 bits
+    make orjson raise, which also falls back to the stdlib encoder.
+    """
+    stack = [obj]
+    pop, push = stack.pop, stack.extend
+    while stack:
+        o = pop()
+        kind = type(o)
+        if kind is dict:
+            push(o.values())
+        elif kind is list or kind is tuple:
+            push(o)
+        elif kind is float:
+            if not (o == 0 or 1e-4 <= abs(o) < 1e16):
+                return False
+        elif kind not in _PLAIN_SCALARS:
+            return False
+    return True
+
+
+def minijson_bytes(obj: Any) -> bytes:
+    """Minified UTF-8 JSON; uses orjson when installed (pip install nav_insights[fast]).
+
+    Output is the same with or without orjson: values orjson would encode
+    differently go to the stdlib encoder.
+    """
+    if orjson is not None and _orjson_exact(obj):
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # e.g. non-str keys or ints beyond 64 bits
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def minijson(obj: Any) -> str:
-    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return minijson_bytes(obj).decode("utf-8")
 
 
 def build_system_prompt(schema_json: str | None, tone: str) -> str:
@@ -112,6 +166,14 @@ def load_case(case_dir: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]], Dic
     return findings, actions, label
 
 
+def load_case_safe(case_dir: Path) -> Tuple[Path, Tuple[Any, ...] | None, Exception | None]:
+    """load_case for worker threads: returns (case_dir, case, error) instead of raising."""
+    try:
+        return case_dir, load_case(case_dir), None
+    except Exception as e:
+        return case_dir, None, e
+
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--input_root", required=True, help="Directory containing case subfolders")
@@ -138,39 +200,57 @@ def main():
     input_root = Path(args.input_root)
     case_dirs = sorted([p for p in input_root.iterdir() if p.is_dir()])
 
-    records = []
-    for d in case_dirs:
-        try:
-            findings, actions, label = load_case(d)
-        except Exception as e:
-            print(f"[SKIP] {d.name}: {e}", file=sys.stderr)
-            continue
-        user_prompt = build_user_prompt(findings, actions)
-        if label is None:
-            label_obj = synthetic_label(findings, actions)
-        else:
-            label_obj = label
-        rec = {
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            "label": minijson(label_obj),
-        }
-        records.append(rec)
-
-    # Split train/eval
-    random.shuffle(records)
-    n_eval = max(1, int(len(records) * args.eval_split)) if records else 0
-    eval_set = records[:n_eval]
-    train_set = records[n_eval:]
-
-    with open(args.out_train, "w", encoding="utf-8") as ftr:
-        for r in train_set:
-            ftr.write(minijson(r) + "\n")
-    with open(args.out_eval, "w", encoding="utf-8") as fev:
-        for r in eval_set:
-            fev.write(minijson(r) + "\n")
+    # Records are spooled to a temp file as they are built, keeping only
+    # (offset, length) per record in memory. Shuffling the index list with the
+    # same seed gives the same split as shuffling the records themselves.
+    spans: List[Tuple[int, int]] = []
+    with tempfile.TemporaryFile() as spool:
+        # Case files are read concurrently, one bounded batch at a time, to
+        # overlap disk latency; records are still built in directory order
+        workers = min(32, len(case_dirs) or 1)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for start in range(0, len(case_dirs), workers * 4):
+                batch = case_dirs[start : start + workers * 4]
+                for d, case, err in ex.map(load_case_safe, batch):
+                    if err is not None:
+                        print(f"[SKIP] {d.name}: {err}", file=sys.stderr)
+                        continue
+                    findings, actions, label = case
+                    user_prompt = build_user_prompt(findings, actions)
+                    if label is None:
+                        label_obj = synthetic_label(findings, actions)
+                    else:
+                        label_obj = label
+                    rec = {
+                        "messages": [
+                            {"role": "system", "content": system_prompt},
+                            {"role": "user", "content": user_prompt},
+                        ],
+                        "label": minijson(label_obj),
+                    }
+                    line = minijson_bytes(rec) + b"\n"
+                    spans.append((spool.tell(), len(line)))
+                    spool.write(line)
+
+        # Split train/eval
+        random.shuffle(spans)
+        n_eval = max(1, int(len(spans) * args.eval_split)) if spans else 0
+        eval_set = spans[:n_eval]
+        train_set = spans[n_eval:]
+
+        for out_path, subset in ((args.out_train, train_set), (args.out_eval, eval_set)):
+            with open(out_path, "wb") as out:
+                # Gather lines into ~4 MiB blocks so each write is one large call
+                block: List[bytes] = []
+                size = 0
+                for offset, length in subset:
+                    spool.seek(offset)
+                    block.append(spool.read(length))
+                    size += length
+                    if size >= _WRITE_BLOCK_BYTES:
+                        out.write(b"".join(block))
+                        block, size = [], 0
+                out.write(b"".join(block))
 
     print(f"[OK] Wrote {len(train_set)} train and {len(eval_set)} eval records.")
     print(f"       {os.path.abspath(args.out_train)}")
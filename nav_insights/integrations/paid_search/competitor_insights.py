@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import hashlib
 import re
-from datetime import datetime, timezone
-from decimal import Decimal
-from typing import Any, Dict, List
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 from pydantic import BaseModel
 
+from ...core.errors import ValidationError
 from ...core.ir_base import (
     AuditFindings,
     AccountMeta,
@@ -15,11 +16,29 @@ from ...core.ir_base import (
     Evidence,
     AnalyzerProvenance,
     Finding,
+    FindingCategory,
     Severity,
     EntityRef,
     EntityType,
     Totals,
 )
+from ...core.utils import safe_decimal_conversion, validate_non_negative_metrics
+
+
+_PARSER_NAME = "competitor_insights"
+_EVIDENCE_SOURCE = "paid_search_nav.competitor_insights"
+
+# Non-negative Decimal metrics copied from each payload section when present
+_COMPETITOR_METRICS = ["impression_share_overlap", "shared_keywords", "monthly_search_volume"]
+_GAP_METRICS = ["search_volume", "estimated_cpc"]
+_SUMMARY_METRICS = [
+    "opportunity_score",
+    "potential_monthly_savings",
+    "competitors_identified",
+    "keyword_overlap_detected",
+]
+# Categorical fields copied verbatim into dims when present
+_COMPETITOR_DIM_KEYS = ("cost_competition_level", "competitive_threat_level")
 
 
 class CompetitorInsightsInput(BaseModel):
@@ -39,31 +58,22 @@ def parse_competitor_insights(data: Dict[str, Any]) -> AuditFindings:
 
     See docs/mappings/paid_search/competitor_insights_to_ir.md for full mapping details.
     """
-    inp = CompetitorInsightsInput.model_validate(data)
+    return _from_input(CompetitorInsightsInput.model_validate(data))
+
+
+def parse_competitor_insights_json(raw: str | bytes) -> AuditFindings:
+    """JSON-text variant of parse_competitor_insights: parses and validates in one pass.
+
+    Prefer this when the payload arrives as text (file, request body): it
+    skips building the intermediate dict that json.loads would produce.
+    """
+    return _from_input(CompetitorInsightsInput.model_validate_json(raw))
+
 
+def _from_input(inp: CompetitorInsightsInput) -> AuditFindings:
     # Determine date range with robust fallbacks
-    if inp.analysis_period:
-        try:
-            start = datetime.fromisoformat(inp.analysis_period["start_date"]).date()
-            end = datetime.fromisoformat(inp.analysis_period["end_date"]).date()
-        except (KeyError, ValueError):
-            try:
-                dt = datetime.fromisoformat(inp.timestamp or "")
-                start = dt.date()
-                end = dt.date()
-            except ValueError:
-                dt = datetime.now(timezone.utc)
-                start = dt.date()
-                end = dt.date()
-    else:
-        try:
-            dt = datetime.fromisoformat(inp.timestamp or "")
-            start = dt.date()
-            end = dt.date()
-        except ValueError:
-            dt = datetime.now(timezone.utc)
-            start = dt.date()
-            end = dt.date()
+    timestamp = _parse_iso(inp.timestamp)
+    start, end = _resolve_date_range(inp.analysis_period, timestamp)
 
     account = AccountMeta(account_id=inp.customer_id or "unknown")
     date_range = DateRange(start_date=start, end_date=end)
@@ -71,43 +81,51 @@ def parse_competitor_insights(data: Dict[str, Any]) -> AuditFindings:
     findings: List[Finding] = []
     global_severity = _map_priority((inp.summary or {}).get("priority_level"))
 
+    # EntityRef is frozen, so one instance per competitor name is shared by
+    # its primary finding and every keyword gap that lists it; its fields are
+    # parser-built strings, so it is constructed without validation
+    competitor_entities: Dict[str, EntityRef] = {}
+
+    def competitor_entity_for(name: str) -> EntityRef:
+        entity = competitor_entities.get(name)
+        if entity is None:
+            entity = competitor_entities[name] = EntityRef.model_construct(
+                type=EntityType.other,
+                id=f"competitor:{_sanitize_id(name, add_hash=True)}",
+                name=name,
+            )
+        return entity
+
     # Primary competitors → one finding per item
     for item in inp.detailed_findings.get("primary_competitors") or []:
         competitor = str(item.get("competitor", "unknown"))
         competitor_clean = _sanitize_id(competitor, add_hash=True)
-        # Create competitor entity
-        competitor_entity = EntityRef(
-            type=EntityType.other, id=f"competitor:{competitor_clean}", name=competitor
-        )
+        competitor_entity = competitor_entity_for(competitor)
 
         # Build metrics
-        metrics: Dict[str, Decimal] = {}
-        if "impression_share_overlap" in item:
-            metrics["impression_share_overlap"] = Decimal(str(item["impression_share_overlap"]))
-        if "average_position_vs_you" in item:
-            metrics["average_position_vs_you"] = Decimal(str(item["average_position_vs_you"]))
-        if "shared_keywords" in item:
-            metrics["shared_keywords"] = Decimal(str(item["shared_keywords"]))
-        if "monthly_search_volume" in item:
-            metrics["monthly_search_volume"] = Decimal(str(item["monthly_search_volume"]))
+        metrics = validate_non_negative_metrics(item, _COMPETITOR_METRICS, _PARSER_NAME)
+        position = item.get("average_position_vs_you")
+        if position is not None and position != "N/A":
+            # Relative position can legitimately be negative
+            metrics["average_position_vs_you"] = safe_decimal_conversion(
+                position, "average_position_vs_you"
+            )
 
         # Build dimensions
-        dims: Dict[str, Any] = {}
-        if "cost_competition_level" in item:
-            dims["cost_competition_level"] = item["cost_competition_level"]
-        if "competitive_threat_level" in item:
-            dims["competitive_threat_level"] = item["competitive_threat_level"]
+        dims: Dict[str, Any] = {k: item[k] for k in _COMPETITOR_DIM_KEYS if k in item}
 
         # Use opportunity text as description if available
-        description = item.get("opportunity", "")
+        description = _optional_text(item.get("opportunity", ""), "opportunity")
 
         # Determine individual severity based on threat level or global fallback
         individual_severity = _determine_competitor_severity(item, global_severity)
 
+        # Every field below is already coerced to its final type, so the
+        # finding (and its evidence) is assembled without re-validation
         findings.append(
-            Finding(
+            Finding.build(
                 id=f"COMPETITOR_{competitor_clean}",
-                category="other",  # fallback until competition category is added
+                category=FindingCategory.other,  # fallback until competition category is added
                 summary=f"Competitor overlap: {competitor}",
                 description=description,
                 severity=individual_severity,
@@ -115,9 +133,7 @@ def parse_competitor_insights(data: Dict[str, Any]) -> AuditFindings:
                 metrics=metrics,
                 dims=dims,
                 evidence=[
-                    Evidence(
-                        source="paid_search_nav.competitor_insights", entities=[competitor_entity]
-                    )
+                    Evidence.model_construct(source=_EVIDENCE_SOURCE, entities=[competitor_entity])
                 ],
             )
         )
@@ -129,27 +145,20 @@ def parse_competitor_insights(data: Dict[str, Any]) -> AuditFindings:
         competitor_using = gap.get("competitor_using", []) or []
 
         # Create keyword entity
-        keyword_entity = EntityRef(type=EntityType.keyword, id=f"kw:{keyword_clean}", name=keyword)
+        keyword_entity = EntityRef.model_construct(
+            type=EntityType.keyword, id=f"kw:{keyword_clean}", name=keyword
+        )
 
         # Create entities for competitors using this keyword
         entities: List[EntityRef] = [keyword_entity]
         for comp in competitor_using:
-            comp_clean = _sanitize_id(str(comp), add_hash=True)
-            entities.append(
-                EntityRef(type=EntityType.other, id=f"competitor:{comp_clean}", name=str(comp))
-            )
+            entities.append(competitor_entity_for(str(comp)))
 
         # Build metrics
-        metrics = {}
-        if "search_volume" in gap:
-            metrics["search_volume"] = Decimal(str(gap["search_volume"]))
-        if "estimated_cpc" in gap:
-            metrics["estimated_cpc"] = Decimal(str(gap["estimated_cpc"]))
+        metrics = validate_non_negative_metrics(gap, _GAP_METRICS, _PARSER_NAME)
 
         # Build dimensions
-        dims = {}
-        if "competition" in gap:
-            dims["competition"] = gap["competition"]
+        dims = {"competition": gap["competition"]} if "competition" in gap else {}
         if competitor_using:
             dims["competitor_list"] = competitor_using
 
@@ -159,55 +168,34 @@ def parse_competitor_insights(data: Dict[str, Any]) -> AuditFindings:
         summary = f"Gap: '{keyword}' used by {competitor_count} {competitor_text}"
 
         # Use recommendation as description
-        description = gap.get("recommendation", "")
+        description = _optional_text(gap.get("recommendation", ""), "recommendation")
 
         # Determine individual severity based on competition level or global fallback
         individual_severity = _determine_keyword_gap_severity(gap, global_severity)
 
         findings.append(
-            Finding(
+            Finding.build(
                 id=f"KEYWORD_GAP_{keyword_clean}",
-                category="other",  # fallback until competition category is added
+                category=FindingCategory.other,  # fallback until competition category is added
                 summary=summary,
                 description=description,
                 severity=individual_severity,
                 entities=entities,
                 metrics=metrics,
                 dims=dims,
-                evidence=[
-                    Evidence(source="paid_search_nav.competitor_insights", entities=entities)
-                ],
+                evidence=[Evidence.model_construct(source=_EVIDENCE_SOURCE, entities=entities[:])],
             )
         )
 
     # Store high-level summary metrics in custom analyzer fields
-    competition_metrics: Dict[str, Decimal] = {}
-    summary_data = inp.summary or {}
-    if summary_data:
-        if "opportunity_score" in summary_data:
-            competition_metrics["opportunity_score"] = Decimal(
-                str(summary_data["opportunity_score"])
-            )
-        if "potential_monthly_savings" in summary_data:
-            competition_metrics["potential_monthly_savings"] = Decimal(
-                str(summary_data["potential_monthly_savings"])
-            )
-        if "competitors_identified" in summary_data:
-            competition_metrics["competitors_identified"] = Decimal(
-                str(summary_data["competitors_identified"])
-            )
-        if "keyword_overlap_detected" in summary_data:
-            competition_metrics["keyword_overlap_detected"] = Decimal(
-                str(summary_data["keyword_overlap_detected"])
-            )
+    competition_metrics = validate_non_negative_metrics(
+        inp.summary or {}, _SUMMARY_METRICS, _PARSER_NAME
+    )
 
     # Create global evidence and provenance
-    evidence = Evidence(source="paid_search_nav.competitor_insights", rows=len(findings))
-    try:
-        finished_at = datetime.fromisoformat(inp.timestamp or "")
-    except ValueError:
-        # Fallback to current time if timestamp is malformed
-        finished_at = datetime.now(timezone.utc)
+    evidence = Evidence(source=_EVIDENCE_SOURCE, rows=len(findings))
+    # Fallback to current time if timestamp is missing or malformed
+    finished_at = timestamp or datetime.now(timezone.utc)
 
     prov = AnalyzerProvenance(
         name=inp.analyzer,
@@ -230,6 +218,49 @@ def parse_competitor_insights(data: Dict[str, Any]) -> AuditFindings:
     return af
 
 
+@lru_cache(maxsize=256)
+def _parse_iso(value: str | None) -> datetime | None:
+    """Parse an ISO timestamp, returning None for missing or malformed input.
+
+    Memoized since batches of payloads repeat the same period strings;
+    datetimes are immutable, so sharing the result is safe.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _resolve_date_range(
+    period: Dict[str, str] | None, timestamp: datetime | None
+) -> Tuple[date, date]:
+    """Use analysis_period when both ends parse, else the timestamp's day, else today."""
+    if period:
+        start = _parse_iso(period.get("start_date"))
+        end = _parse_iso(period.get("end_date"))
+        if start is not None and end is not None:
+            return start.date(), end.date()
+    day = (timestamp or datetime.now(timezone.utc)).date()
+    return day, day
+
+
+def _optional_text(value: Any, field_name: str) -> str | None:
+    """Return a free-text payload field, rejecting anything but str or None."""
+    if value is None or isinstance(value, str):
+        return value
+    raise ValidationError(
+        f"Field '{field_name}' must be a string",
+        field_name=field_name,
+        field_value=value,
+        context={"parser_name": _PARSER_NAME},
+    )
+
+
+_SEVERITY_RANK = {Severity.low: 0, Severity.medium: 1, Severity.high: 2}
+
+
 def _determine_competitor_severity(item: Dict[str, Any], global_severity: Severity) -> Severity:
     """Determine severity for competitor finding based on individual threat levels.
 
@@ -245,8 +276,9 @@ def _determine_competitor_severity(item: Dict[str, Any], global_severity: Severi
 
     # Use the higher severity, or global if neither available
     if threat_severity and cost_severity:
-        severity_order = {"low": 0, "medium": 1, "high": 2}
-        return max(threat_severity, cost_severity, key=lambda s: severity_order[str(s)])  # type: ignore[arg-type]
+        if _SEVERITY_RANK[threat_severity] >= _SEVERITY_RANK[cost_severity]:
+            return threat_severity
+        return cost_severity
     if threat_severity:
         return threat_severity
     if cost_severity:
@@ -266,18 +298,25 @@ def _determine_keyword_gap_severity(gap: Dict[str, Any], global_severity: Severi
 
 
 def _map_priority(level: Any) -> Severity:
-    """Map priority level to severity string.
+    """Map priority level to Severity enum.
 
-    CRITICAL→high, HIGH→high, MEDIUM→medium, LOW→low
+    CRITICAL→high, HIGH→high, MEDIUM→medium, anything else→low
     """
-    s = str(level or "").lower()
-    if s in ("critical", "high"):
-        return "high"  # type: ignore[return-value]
-    if s == "medium":
-        return "medium"  # type: ignore[return-value]
-    return "low"  # type: ignore[return-value]
+    return _PRIORITY_MAP.get(str(level or "").lower(), Severity.low)
+
 
+_PRIORITY_MAP = {"critical": Severity.high, "high": Severity.high, "medium": Severity.medium}
 
+
+# One underscore per character (no run collapsing): existing entity IDs
+# such as "competitor:McDonald_s___Co__" must stay stable
+_UNSAFE_ID_CHAR = re.compile(r"[^a-zA-Z0-9_-]")
+_UNSAFE_ID_BYTES = bytes(
+    c if chr(c).isascii() and (chr(c).isalnum() or chr(c) in "_-") else ord("_") for c in range(256)
+)
+
+
+@lru_cache(maxsize=4096)
 def _sanitize_id(text: str, add_hash: bool = False) -> str:
     """Sanitize text for use in entity IDs by replacing spaces and special chars.
 
@@ -285,7 +324,12 @@ def _sanitize_id(text: str, add_hash: bool = False) -> str:
         text: The text to sanitize
         add_hash: If True, adds a short hash suffix to prevent collisions
     """
-    sanitized = re.sub(r"[^a-zA-Z0-9_-]", "_", text.strip())
+    text_stripped = text.strip()
+    if text_stripped.isascii():
+        # Byte-level table lookup; much cheaper than the regex on short names
+        sanitized = text_stripped.encode("ascii").translate(_UNSAFE_ID_BYTES).decode("ascii")
+    else:
+        sanitized = _UNSAFE_ID_CHAR.sub("_", text_stripped)
 
     if add_hash:
         # Add a short hash suffix to prevent collisions
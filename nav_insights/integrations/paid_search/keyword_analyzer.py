@@ -1,11 +1,12 @@
 from __future__ import annotations
 from datetime import datetime, timezone
+from functools import lru_cache
 import hashlib
 from decimal import Decimal, InvalidOperation
 from typing import Any, Dict, List
 
 from pydantic import BaseModel
-from ...core.errors import CoreError
+from ...core.errors import CoreError, ValidationError
 
 from ...core.ir_base import (
     AuditFindings,
@@ -14,11 +15,13 @@ from ...core.ir_base import (
     Evidence,
     AnalyzerProvenance,
     Finding,
+    FindingCategory,
     Severity,
     EntityRef,
+    EntityType,
     Totals,
 )
-from ...core.utils import map_priority_level
+from ...core.utils import map_priority_level, to_decimal
 
 
 class KeywordAnalyzerInput(BaseModel):
@@ -35,15 +38,32 @@ def parse_keyword_analyzer(data: Dict[str, Any]) -> AuditFindings:
 
     See docs/mappings/paid_search/keyword_analyzer_to_ir.md for full mapping details.
     """
-    inp = KeywordAnalyzerInput.model_validate(data)
+    return _from_input(KeywordAnalyzerInput.model_validate(data))
 
+
+def parse_keyword_analyzer_json(raw: str | bytes) -> AuditFindings:
+    """JSON-text variant of parse_keyword_analyzer: parses and validates in one pass.
+
+    Prefer this when the payload arrives as text (file, request body): it
+    skips building the intermediate dict that json.loads would produce.
+    """
+    return _from_input(KeywordAnalyzerInput.model_validate_json(raw))
+
+
+@lru_cache(maxsize=256)
+def _parse_iso(value: str) -> datetime:
+    """datetime.fromisoformat, memoized: batches repeat the same period strings."""
+    return datetime.fromisoformat(value)
+
+
+def _from_input(inp: KeywordAnalyzerInput) -> AuditFindings:
     try:
-        start = datetime.fromisoformat(inp.analysis_period["start_date"]).date()
-        end = datetime.fromisoformat(inp.analysis_period["end_date"]).date()
+        start = _parse_iso(inp.analysis_period["start_date"]).date()
+        end = _parse_iso(inp.analysis_period["end_date"]).date()
     except (KeyError, ValueError):
         # Fallback to timestamp-based date if analysis_period is malformed
         try:
-            dt = datetime.fromisoformat(inp.timestamp)
+            dt = _parse_iso(inp.timestamp)
             start = dt.date()
             end = dt.date()
         except ValueError:
@@ -58,25 +78,28 @@ def parse_keyword_analyzer(data: Dict[str, Any]) -> AuditFindings:
     findings: List[Finding] = []
     finding_counter = 0
 
+    # Summary priority applies to every underperforming keyword
+    summary_severity = map_priority_level(inp.summary.get("priority_level"))
+
     # Underperforming keywords → findings
     for item in inp.detailed_findings.get("underperforming_keywords", []) or []:
         finding_counter += 1
         name = str(item.get("name", "unknown")).strip() or "unknown"
         match_type = str(item.get("match_type", "UNKNOWN")).upper()
         campaign = str(item.get("campaign", "")).strip() or "Unknown Campaign"
-        recommendation = item.get("recommendation") or "Review keyword performance"
+        recommendation = _recommendation_text(item, "Review keyword performance")
 
         summary = f"Underperforming keyword '{name}' ({match_type})"
-        severity = map_priority_level(inp.summary.get("priority_level"))
 
         # Build metrics, handling N/A values and ensuring non-negative values
-        cost = Decimal(str(item.get("cost", 0)))
-        conversions = Decimal(str(item.get("conversions", 0)))
-        if cost < 0 or conversions < 0:
+        cost = to_decimal(item.get("cost", 0))
+        conversions = to_decimal(item.get("conversions", 0))
+        # Findings are built without validation, so NaN/Infinity must be caught here
+        if not (cost.is_finite() and conversions.is_finite()) or cost < 0 or conversions < 0:
             raise CoreError(
                 code="invalid_metric",
                 category="parser.keyword",
-                message="Cost and conversions must be non-negative",
+                message="Cost and conversions must be finite and non-negative",
                 severity="error",
                 context={"name": name, "cost": str(cost), "conversions": str(conversions)},
             )
@@ -86,25 +109,37 @@ def parse_keyword_analyzer(data: Dict[str, Any]) -> AuditFindings:
         }
         if (cpa := item.get("cpa")) not in (None, "N/A"):
             try:
-                metrics["cpa"] = Decimal(str(cpa))
+                cpa_value = to_decimal(cpa)
             except (InvalidOperation, ValueError):
                 # Skip invalid CPA values (e.g., non-numeric strings)
                 pass
+            else:
+                if not cpa_value.is_finite():
+                    raise CoreError(
+                        code="invalid_metric",
+                        category="parser.keyword",
+                        message="CPA must be a finite number",
+                        severity="error",
+                        context={"name": name, "cpa": str(cpa)},
+                    )
+                metrics["cpa"] = cpa_value
 
         # Build entities according to spec
         entities = [
-            EntityRef(type="keyword", id=f"kw:{name}", name=name),
-            EntityRef(type="campaign", id=f"cmp:{campaign}", name=campaign),
+            EntityRef.model_construct(type=EntityType.keyword, id=f"kw:{name}", name=name),
+            EntityRef.model_construct(
+                type=EntityType.campaign, id=f"cmp:{campaign}", name=campaign
+            ),
         ]
 
         name_hash = hashlib.md5(name.encode()).hexdigest()[:8]
         findings.append(
-            Finding(
+            Finding.build(
                 id=f"keyword_analyzer_{inp.customer_id}_under_{finding_counter}_{name[:15].replace(' ', '_')}_{name_hash}",
-                category="keywords",
+                category=FindingCategory.keywords,
                 summary=summary,
                 description=recommendation,
-                severity=severity,
+                severity=summary_severity,
                 entities=entities,
                 dims={"match_type": match_type, "campaign": campaign},
                 metrics=metrics,
@@ -117,20 +152,21 @@ def parse_keyword_analyzer(data: Dict[str, Any]) -> AuditFindings:
         name = str(item.get("name", "unknown")).strip() or "unknown"
         match_type = str(item.get("match_type", "UNKNOWN")).upper()
         campaign = str(item.get("campaign", "")).strip() or "Unknown Campaign"
-        recommendation = item.get("recommendation") or "Continue monitoring performance"
+        recommendation = _recommendation_text(item, "Continue monitoring performance")
 
         summary = f"Top performing keyword '{name}' ({match_type})"
         # Top performers typically have low severity since they're performing well
         severity = Severity.low
 
         # Build metrics
-        cost = Decimal(str(item.get("cost", 0)))
-        conversions = Decimal(str(item.get("conversions", 0)))
-        if cost < 0 or conversions < 0:
+        cost = to_decimal(item.get("cost", 0))
+        conversions = to_decimal(item.get("conversions", 0))
+        # Findings are built without validation, so NaN/Infinity must be caught here
+        if not (cost.is_finite() and conversions.is_finite()) or cost < 0 or conversions < 0:
             raise CoreError(
                 code="invalid_metric",
                 category="parser.keyword",
-                message="Cost and conversions must be non-negative",
+                message="Cost and conversions must be finite and non-negative",
                 severity="error",
                 context={"name": name, "cost": str(cost), "conversions": str(conversions)},
             )
@@ -140,22 +176,34 @@ def parse_keyword_analyzer(data: Dict[str, Any]) -> AuditFindings:
         }
         if (cpa := item.get("cpa")) not in (None, "N/A"):
             try:
-                metrics["cpa"] = Decimal(str(cpa))
+                cpa_value = to_decimal(cpa)
             except (InvalidOperation, ValueError):
                 # Skip invalid CPA values (e.g., non-numeric strings)
                 pass
+            else:
+                if not cpa_value.is_finite():
+                    raise CoreError(
+                        code="invalid_metric",
+                        category="parser.keyword",
+                        message="CPA must be a finite number",
+                        severity="error",
+                        context={"name": name, "cpa": str(cpa)},
+                    )
+                metrics["cpa"] = cpa_value
 
         # Build entities according to spec
         entities = [
-            EntityRef(type="keyword", id=f"kw:{name}", name=name),
-            EntityRef(type="campaign", id=f"cmp:{campaign}", name=campaign),
+            EntityRef.model_construct(type=EntityType.keyword, id=f"kw:{name}", name=name),
+            EntityRef.model_construct(
+                type=EntityType.campaign, id=f"cmp:{campaign}", name=campaign
+            ),
         ]
 
         name_hash = hashlib.md5(name.encode()).hexdigest()[:8]
         findings.append(
-            Finding(
+            Finding.build(
                 id=f"keyword_analyzer_{inp.customer_id}_top_{finding_counter}_{name[:15].replace(' ', '_')}_{name_hash}",
-                category="keywords",
+                category=FindingCategory.keywords,
                 summary=summary,
                 description=recommendation,
                 severity=severity,
@@ -178,7 +226,7 @@ def parse_keyword_analyzer(data: Dict[str, Any]) -> AuditFindings:
     evidence = Evidence(source="paid_search_nav.keyword")
 
     try:
-        finished_at = datetime.fromisoformat(inp.timestamp)
+        finished_at = _parse_iso(inp.timestamp)
     except ValueError:
         # Fallback to current time if timestamp is malformed
         finished_at = datetime.now(timezone.utc)
@@ -199,3 +247,16 @@ def parse_keyword_analyzer(data: Dict[str, Any]) -> AuditFindings:
         index=index,
     )
     return af
+
+
+def _recommendation_text(item: Dict[str, Any], default: str) -> str:
+    """Return the item's recommendation text, rejecting non-string values."""
+    value = item.get("recommendation") or default
+    if not isinstance(value, str):
+        raise ValidationError(
+            "Field 'recommendation' must be a string",
+            field_name="recommendation",
+            field_value=value,
+            context={"parser_name": "keyword_analyzer"},
+        )
+    return value
@@ -18,6 +18,7 @@ from ...core.ir_base import (
     EntityRef,
     EntityType,
 )
+from ...core.utils import to_decimal
 
 
 class PlacementAuditInput(BaseModel):
@@ -59,10 +60,10 @@ def parse_placement_audit(data: Dict[str, Any]) -> AuditFindings:
         severity = _map_priority(inp.summary.get("priority_level"))
 
         metrics: Dict[str, Decimal] = {
-            "cost": Decimal(str(item.get("cost", 0) or 0)),
-            "conversions": Decimal(str(item.get("conversions", 0) or 0)),
-            "clicks": Decimal(str(item.get("clicks", 0) or 0)),
-            "impressions": Decimal(str(item.get("impressions", 0) or 0)),
+            "cost": to_decimal(item.get("cost", 0) or 0),
+            "conversions": to_decimal(item.get("conversions", 0) or 0),
+            "clicks": to_decimal(item.get("clicks", 0) or 0),
+            "impressions": to_decimal(item.get("impressions", 0) or 0),
         }
 
         # Handle rate conversions - ensure they're in [0,1] range
@@ -89,7 +90,7 @@ def parse_placement_audit(data: Dict[str, Any]) -> AuditFindings:
         # Handle CPA - omit if N/A
         if (cpa := item.get("cpa")) not in (None, "N/A"):
             try:
-                metrics["cpa"] = Decimal(str(cpa))
+                metrics["cpa"] = to_decimal(cpa)
             except (ValueError, TypeError):
                 pass  # Omit invalid CPA values
 
@@ -126,10 +127,10 @@ def parse_placement_audit(data: Dict[str, Any]) -> AuditFindings:
         severity = Severity.low  # Top performers are typically informational
 
         metrics: Dict[str, Decimal] = {
-            "cost": Decimal(str(item.get("cost", 0) or 0)),
-            "conversions": Decimal(str(item.get("conversions", 0) or 0)),
-            "clicks": Decimal(str(item.get("clicks", 0) or 0)),
-            "impressions": Decimal(str(item.get("impressions", 0) or 0)),
+            "cost": to_decimal(item.get("cost", 0) or 0),
+            "conversions": to_decimal(item.get("conversions", 0) or 0),
+            "clicks": to_decimal(item.get("clicks", 0) or 0),
+            "impressions": to_decimal(item.get("impressions", 0) or 0),
         }
 
         # Handle rate conversions
@@ -154,7 +155,7 @@ def parse_placement_audit(data: Dict[str, Any]) -> AuditFindings:
         # Handle CPA - omit if N/A
         if (cpa := item.get("cpa")) not in (None, "N/A"):
             try:
-                metrics["cpa"] = Decimal(str(cpa))
+                metrics["cpa"] = to_decimal(cpa)
             except (ValueError, TypeError):
                 pass  # Omit invalid CPA values
 
@@ -244,11 +245,21 @@ def _normalize_network(network: str) -> str:
     return normalized if normalized else "Unknown"
 
 
+# ASCII bytes that are not alphanumeric, "." or "-" map to "_"
+_UNSAFE_ID_BYTES = bytes(
+    c if chr(c).isascii() and (chr(c).isalnum() or chr(c) in ".-") else ord("_") for c in range(256)
+)
+
+
 def _sanitize_id(placement_url: str) -> str:
     """Sanitize placement URL for use in Finding IDs."""
     # Remove protocol and common prefixes, limit length
     sanitized = placement_url.replace("https://", "").replace("http://", "").replace("www.", "")
     # Replace special characters with underscores for valid IDs
-    sanitized = "".join(c if c.isalnum() or c in ".-" else "_" for c in sanitized)
+    if sanitized.isascii():
+        sanitized = sanitized.encode("ascii").translate(_UNSAFE_ID_BYTES).decode("ascii")
+    else:
+        # isalnum() is Unicode-aware, so non-ASCII letters/digits are kept
+        sanitized = "".join(c if c.isalnum() or c in ".-" else "_" for c in sanitized)
     # Limit length to prevent excessively long IDs
     return sanitized[:50]
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from decimal import Decimal
 from typing import Any, Dict, List
 
 from pydantic import BaseModel
@@ -18,6 +17,7 @@ from ...core.ir_base import (
     EntityType,
     Totals,
 )
+from ...core.utils import to_decimal
 
 
 class SearchTermsInput(BaseModel):
@@ -76,12 +76,14 @@ def parse_search_terms(data: Dict[str, Any]) -> AuditFindings:
 
     findings: List[Finding] = []
 
+    # Summary priority applies to every finding in this payload
+    severity = _map_priority(inp.summary.get("priority_level") if inp.summary else None)
+
     # Wasteful search terms
     for item in inp.detailed_findings.get("wasteful_search_terms") or []:
         term = str(item.get("term", ""))
         kw = item.get("keyword_triggered")
         summary = f"Wasteful search term '{term}' — add negative"
-        severity = _map_priority(inp.summary.get("priority_level") if inp.summary else None)
 
         # Create entities as per spec
         entities = [EntityRef(type=EntityType.search_term, id=f"st:{term}", name=term)]
@@ -98,9 +100,9 @@ def parse_search_terms(data: Dict[str, Any]) -> AuditFindings:
                 entities=entities,
                 dims={"keyword_triggered": kw} if kw else {},
                 metrics={
-                    "cost": Decimal(str(item.get("cost", 0))),
-                    "conversions": Decimal(str(item.get("conversions", 0))),
-                    "clicks": Decimal(str(item.get("clicks", 0))),
+                    "cost": to_decimal(item.get("cost", 0)),
+                    "conversions": to_decimal(item.get("conversions", 0)),
+                    "clicks": to_decimal(item.get("clicks", 0)),
                 },
             )
         )
@@ -109,7 +111,6 @@ def parse_search_terms(data: Dict[str, Any]) -> AuditFindings:
     for item in inp.detailed_findings.get("negative_keyword_suggestions") or []:
         neg = str(item.get("negative_keyword", ""))
         summary = f"Negative keyword suggestion '{neg}'"
-        severity = _map_priority(inp.summary.get("priority_level") if inp.summary else None)
 
         # Build dims according to spec
         dims: Dict[str, Any] = {}
@@ -127,7 +128,7 @@ def parse_search_terms(data: Dict[str, Any]) -> AuditFindings:
                 severity=severity,
                 entities=[],  # No specific entities for suggestions per spec
                 dims=dims,
-                metrics={"estimated_savings_usd": Decimal(str(item.get("estimated_savings", 0)))},
+                metrics={"estimated_savings_usd": to_decimal(item.get("estimated_savings", 0))},
             )
         )
 
@@ -157,9 +158,7 @@ def parse_search_terms(data: Dict[str, Any]) -> AuditFindings:
 
 
 def _map_priority(level: Any) -> Severity:
-    s = str(level or "").lower()
-    if s in ("critical", "high"):
-        return "high"  # type: ignore[return-value]
-    if s == "medium":
-        return "medium"  # type: ignore[return-value]
-    return "low"  # type: ignore[return-value]
+    return _PRIORITY_MAP.get(str(level or "").lower(), Severity.low)
+
+
+_PRIORITY_MAP = {"critical": Severity.high, "high": Severity.high, "medium": Severity.medium}
@@ -19,6 +19,7 @@ from ...core.findings_ir import (
     EntityRef,
     EntityType,
 )
+from ...core.utils import to_decimal
 
 
 class VideoCreativeInput(BaseModel):
@@ -105,14 +106,14 @@ def _build_metrics(item: Dict[str, Any]) -> Dict[str, Decimal]:
     for field in metric_fields:
         if field in item:
             try:
-                metrics[field] = Decimal(str(item[field]))
+                metrics[field] = to_decimal(item[field])
             except (ValueError, TypeError):
                 metrics[field] = Decimal("0")
 
     # View rate with validation
     if "view_rate" in item:
         try:
-            view_rate = Decimal(str(item["view_rate"]))
+            view_rate = to_decimal(item["view_rate"])
             # Ensure it's in [0,1] range
             if view_rate < 0 or view_rate > 1:
                 view_rate = max(Decimal("0"), min(Decimal("1"), view_rate))
@@ -123,7 +124,7 @@ def _build_metrics(item: Dict[str, Any]) -> Dict[str, Decimal]:
     # Micro-to-USD conversions
     if "cost_micros" in item:
         try:
-            cost_micros = Decimal(str(item["cost_micros"]))
+            cost_micros = to_decimal(item["cost_micros"])
             metrics["cost_usd"] = cost_micros / Decimal("1000000")
         except (ValueError, TypeError):
             pass  # Skip invalid cost values
@@ -132,7 +133,7 @@ def _build_metrics(item: Dict[str, Any]) -> Dict[str, Decimal]:
     cpa_micros = item.get("cpa_micros")
     if cpa_micros is not None and str(cpa_micros).upper() != "N/A":
         try:
-            cpa_value = Decimal(str(cpa_micros))
+            cpa_value = to_decimal(cpa_micros)
             metrics["cpa_usd"] = cpa_value / Decimal("1000000")
         except (ValueError, TypeError):
             pass  # Skip invalid CPA values
@@ -223,7 +224,11 @@ def _build_creative_finding(
         entities=entities,
         metrics=metrics,
         dims=dims,
-        evidence=[Evidence(source="paid_search_nav.video_creative", entities=[creative_entity])],
+        evidence=[
+            Evidence.model_construct(
+                source="paid_search_nav.video_creative", entities=[creative_entity]
+            )
+        ],
     )
 
 
@@ -281,7 +286,7 @@ def parse_video_creative(data: Dict[str, Any]) -> AuditFindings:
     totals = Totals()
     if "total_video_spend_micros" in inp.summary:
         spend_micros = inp.summary["total_video_spend_micros"]
-        totals.spend_usd = Decimal(str(spend_micros)) / Decimal("1000000")
+        totals.spend_usd = to_decimal(spend_micros) / Decimal("1000000")
 
     # Build aggregates with video-specific metrics
     aggregates = Aggregates()
@@ -289,13 +294,13 @@ def parse_video_creative(data: Dict[str, Any]) -> AuditFindings:
     summary_data = inp.summary
 
     if "total_video_creatives" in summary_data:
-        video_metrics["total_video_creatives"] = Decimal(str(summary_data["total_video_creatives"]))
+        video_metrics["total_video_creatives"] = to_decimal(summary_data["total_video_creatives"])
     if "poor_performers_count" in summary_data:
-        video_metrics["poor_performers_count"] = Decimal(str(summary_data["poor_performers_count"]))
+        video_metrics["poor_performers_count"] = to_decimal(summary_data["poor_performers_count"])
     if "top_performers_count" in summary_data:
-        video_metrics["top_performers_count"] = Decimal(str(summary_data["top_performers_count"]))
+        video_metrics["top_performers_count"] = to_decimal(summary_data["top_performers_count"])
     if "average_view_rate" in summary_data:
-        video_metrics["average_view_rate"] = Decimal(str(summary_data["average_view_rate"]))
+        video_metrics["average_view_rate"] = to_decimal(summary_data["average_view_rate"])
 
     # Create global evidence and provenance
     evidence = Evidence(source="paid_search_nav.video_creative", rows=len(findings))
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import pickle
 
-from nav_insights.core.errors import CoreError, to_core_error
+from nav_insights.core.errors import (
+    CoreError,
+    NegativeMetricError,
+    ParserError,
+    ValidationError,
+    to_core_error,
+)
 from nav_insights.core import dsl_exceptions as dslx
 
 
@@ -37,3 +44,40 @@ def test_to_core_error_fallback():
         assert ce.code == "unhandled_exception"
         assert ce.category == "service"
         assert "boom" in ce.message
+
+
+def test_to_core_error_maps_dsl_subclasses_to_nearest_base():
+    class CustomParseError(dslx.ParseError):
+        pass
+
+    assert to_core_error(CustomParseError("x")).code == "parse_error"
+    assert to_core_error(dslx.ExpressionError("x")).code == "expression_error"
+    assert to_core_error(ValueError("x")).context == {}
+
+
+def test_to_dict_severity_tracks_reassignment():
+    err = CoreError("x")
+    assert err.to_dict()["severity"] == "medium"
+    err.severity = "error"
+    assert err.to_dict()["severity"] == "error"
+    assert "code" not in err.to_dict()
+
+
+def test_core_errors_round_trip_through_pickle():
+    err = NegativeMetricError("cost", -1, context={"row": 3})
+    copy = pickle.loads(pickle.dumps(err))
+    assert type(copy) is NegativeMetricError
+    assert copy.to_dict() == err.to_dict()
+    assert copy.args == err.args
+
+
+def test_subclasses_copy_context_only_when_adding_keys():
+    ctx = {"row": 3}
+    assert ValidationError("x", context=ctx).context is ctx
+    assert ParserError("x", context=ctx).context is ctx
+
+    err = ValidationError("x", field_name="cost", context=ctx)
+    assert err.context == {"row": 3, "field_name": "cost"}
+    err = ParserError("x", parser_name="kw", context=ctx)
+    assert err.context == {"row": 3, "parser_name": "kw"}
+    assert ctx == {"row": 3}
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from nav_insights.core.actions import ActionImpact
+from nav_insights.core.validation import to_minified_json
+
+
+def test_to_minified_json_is_compact_and_drops_none():
+    impact = ActionImpact(spend_savings_usd=10, risk="low")
+    out = to_minified_json(impact)
+    assert " " not in out
+    assert "null" not in out
+    assert ActionImpact.model_validate_json(out) == impact
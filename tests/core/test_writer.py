@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from nav_insights.core import writer
+
+
+class _StubSession:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _StubClient:
+    """Records how it is used instead of calling a model server."""
+
+    def __init__(self, base_url, model, timeout):
+        self.key = (base_url, model, timeout)
+        self.session = _StubSession()
+        self.busy = False
+        self.calls = 0
+
+    def generate_structured(self, schema_model, system, user):
+        # A client (and its Session) must never serve two calls at once
+        assert not self.busy
+        self.busy = True
+        time.sleep(0.001)
+        self.busy = False
+        self.calls += 1
+        return user
+
+
+@pytest.fixture
+def created(monkeypatch):
+    clients = []
+
+    def make_client(base_url, model, timeout):
+        client = _StubClient(base_url, model, timeout)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(writer, "LlamaCppClient", make_client)
+    monkeypatch.setattr(writer, "_idle_clients", {})
+    return clients
+
+
+def test_batch_preserves_order_without_sharing_clients(created):
+    cases = [({"case": i}, []) for i in range(40)]
+
+    results = writer.compose_insight_json_batch(cases, object, max_workers=4)
+
+    assert [r.split("Facts:\n")[1].split("\n")[0] for r in results] == [
+        f'{{"case":{i}}}' for i in range(40)
+    ]
+    assert 1 <= len(created) <= 4
+    assert sum(c.calls for c in created) == 40
+
+
+def test_batches_reuse_pooled_clients_until_closed(created):
+    cases = [({"case": i}, []) for i in range(20)]
+    writer.compose_insight_json_batch(cases, object, max_workers=4)
+    first = list(created)
+    writer.compose_insight_json_batch(cases, object, max_workers=4)
+    writer.compose_insight_json({"single": True}, [], object)
+
+    assert created == first
+    assert not any(c.session.closed for c in created)
+
+    writer.close_clients()
+    assert all(c.session.closed for c in created)
+    writer.compose_insight_json({"single": True}, [], object)
+    assert len(created) == len(first) + 1
+
+
+def test_pool_closes_clients_beyond_idle_limit(created, monkeypatch):
+    monkeypatch.setattr(writer, "_MAX_IDLE_CLIENTS", 1)
+    barrier = threading.Barrier(3)
+
+    def call():
+        with writer._pooled_client("http://h/v1", "m", 5):
+            barrier.wait()
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(created) == 3
+    assert sum(not c.session.closed for c in created) == 1
+    assert len(writer._idle_clients[("http://h/v1", "m", 5)]) == 1
@@ -1,12 +1,23 @@
 import json
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from pathlib import Path
-from nav_insights.integrations.paid_search.competitor_insights import parse_competitor_insights
-from nav_insights.integrations.paid_search.keyword_analyzer import parse_keyword_analyzer
+
+import pytest
+
+from nav_insights.core.errors import CoreError, NegativeMetricError, ValidationError
+from nav_insights.integrations.paid_search.competitor_insights import (
+    parse_competitor_insights,
+    parse_competitor_insights_json,
+)
+from nav_insights.integrations.paid_search.keyword_analyzer import (
+    parse_keyword_analyzer,
+    parse_keyword_analyzer_json,
+)
 from nav_insights.integrations.paid_search.search_terms import parse_search_terms
 from nav_insights.integrations.paid_search.placement_audit import parse_placement_audit
 from nav_insights.integrations.paid_search.video_creative import parse_video_creative
-from nav_insights.core.findings_ir import AuditFindings
+from nav_insights.core.findings_ir import AuditFindings, Finding
 
 
 def test_competitor_insights_smoke():
@@ -142,6 +153,10 @@ def test_competitor_insights_comprehensive():
     # Check evidence
     assert len(cracker_barrel_finding.evidence) == 1
     assert cracker_barrel_finding.evidence[0].source == "paid_search_nav.competitor_insights"
+    # Constructed without validation, but identical to the validated form
+    for finding in af.findings:
+        for ev in finding.evidence:
+            assert type(ev).model_validate(ev.model_dump()) == ev
 
     # Check keyword gap findings
     keyword_gap_findings = [f for f in af.findings if f.id.startswith("KEYWORD_GAP_")]
@@ -1107,6 +1122,109 @@ def test_keyword_analyzer_finding_id_uniqueness():
     assert all("keyword_analyzer_test123" in id for id in finding_ids)
 
 
+@pytest.mark.parametrize("bad", ["NaN", "Infinity", "-Infinity", float("nan"), float("inf")])
+def test_parsers_reject_non_finite_metrics(bad):
+    """NaN/Infinity metrics are rejected at parse time, not left for re-validation."""
+    fixtures = Path(__file__).parent.parent / "fixtures"
+    for field in ("cost", "cpa"):
+        sample = json.loads((fixtures / "keyword_analyzer_happy_path.json").read_text())
+        sample["detailed_findings"]["underperforming_keywords"][0][field] = bad
+        with pytest.raises(CoreError, match="finite"):
+            parse_keyword_analyzer(sample)
+
+    for section, item in [
+        ("primary_competitors", {"competitor": "IHOP", "shared_keywords": bad}),
+        ("primary_competitors", {"competitor": "IHOP", "average_position_vs_you": bad}),
+        ("keyword_gaps", {"keyword": "pancakes", "estimated_cpc": bad}),
+    ]:
+        with pytest.raises(ValidationError, match="finite"):
+            parse_competitor_insights(
+                {
+                    "analyzer": "CompetitorInsightsAnalyzer",
+                    "customer_id": "1",
+                    "timestamp": "2025-08-24T10:00:00",
+                    "summary": {},
+                    "detailed_findings": {section: [item]},
+                }
+            )
+
+
+@pytest.mark.parametrize("bad", [42, {"text": "x"}, ["x"]])
+def test_parsers_reject_non_string_descriptions(bad):
+    """Free-text fields are not coerced with str(); non-string values raise."""
+    fixtures = Path(__file__).parent.parent / "fixtures"
+    for section in ("underperforming_keywords", "top_performers"):
+        sample = json.loads((fixtures / "keyword_analyzer_happy_path.json").read_text())
+        sample["detailed_findings"][section][0]["recommendation"] = bad
+        with pytest.raises(ValidationError, match="recommendation"):
+            parse_keyword_analyzer(sample)
+
+    for section, item in [
+        ("primary_competitors", {"competitor": "IHOP", "opportunity": bad}),
+        ("keyword_gaps", {"keyword": "pancakes", "recommendation": bad}),
+    ]:
+        with pytest.raises(ValidationError, match="must be a string"):
+            parse_competitor_insights(
+                {
+                    "analyzer": "CompetitorInsightsAnalyzer",
+                    "customer_id": "1",
+                    "timestamp": "2025-08-24T10:00:00",
+                    "summary": {},
+                    "detailed_findings": {section: [item]},
+                }
+            )
+
+
+def test_constructed_findings_round_trip():
+    """Findings built without validation must equal their validated round trip."""
+    fixtures = Path(__file__).parent.parent / "fixtures"
+    sample = json.loads((fixtures / "keyword_analyzer_happy_path.json").read_text())
+    findings = parse_keyword_analyzer(sample).findings
+    findings += parse_competitor_insights(
+        {
+            "analyzer": "CompetitorInsightsAnalyzer",
+            "customer_id": "1",
+            "timestamp": "2025-08-24T10:00:00",
+            "summary": {},
+            "detailed_findings": {
+                "primary_competitors": [{"competitor": "IHOP", "opportunity": None}],
+                "keyword_gaps": [{"keyword": "pancakes", "competitor_using": ["IHOP"]}],
+            },
+        }
+    ).findings
+    for finding in findings:
+        assert Finding.model_validate(finding.model_dump()) == finding
+        assert Finding.model_validate_json(finding.model_dump_json()) == finding
+
+    # The competitor EntityRef is built once and shared by the gap that lists it
+    competitor_finding, gap_finding = findings[-2:]
+    assert gap_finding.entities[1] is competitor_finding.entities[0]
+
+
+def test_json_entry_points_match_dict_parsers():
+    """The *_json parsers accept raw text and produce the same findings."""
+    fixtures = Path(__file__).parent.parent / "fixtures"
+    raw = (fixtures / "keyword_analyzer_happy_path.json").read_bytes()
+    assert (
+        parse_keyword_analyzer_json(raw).findings
+        == parse_keyword_analyzer(json.loads(raw)).findings
+    )
+
+    competitor = {
+        "analyzer": "CompetitorInsightsAnalyzer",
+        "customer_id": "1",
+        "timestamp": "2025-08-24T10:00:00",
+        "summary": {"priority_level": "HIGH", "opportunity_score": 0.75},
+        "detailed_findings": {
+            "primary_competitors": [{"competitor": "IHOP", "impression_share_overlap": 0.4}],
+            "keyword_gaps": [{"keyword": "pancakes", "search_volume": 10}],
+        },
+    }
+    from_text = parse_competitor_insights_json(json.dumps(competitor))
+    assert from_text.findings == parse_competitor_insights(competitor).findings
+    assert from_text.index == parse_competitor_insights(competitor).index
+
+
 def test_keyword_analyzer_missing_fields():
     """Test KeywordAnalyzer parser handles missing optional fields gracefully"""
     from nav_insights.integrations.paid_search.keyword_analyzer import parse_keyword_analyzer
@@ -1653,3 +1771,40 @@ def test_video_creative_input_validation():
     # Values should be clamped to valid ranges
     assert finding.metrics["view_rate"] == Decimal("1.0")  # Clamped to 1.0
     assert finding.metrics["performance_score"] == Decimal("0")  # Clamped to 0
+
+
+def test_competitor_insights_metric_validation():
+    """Test shared metric validation: N/A skipped, negatives rejected except relative position."""
+    sample = {
+        "analyzer": "CompetitorInsightsAnalyzer",
+        "customer_id": "metrics-test",
+        "timestamp": "2025-08-24T12:00:00",
+        "summary": {"opportunity_score": "N/A", "competitors_identified": 2},
+        "detailed_findings": {
+            "primary_competitors": [
+                {"competitor": "A", "shared_keywords": None, "average_position_vs_you": -0.5}
+            ],
+            "keyword_gaps": [{"keyword": "k", "estimated_cpc": 1.25}],
+        },
+    }
+    af = parse_competitor_insights(sample)
+    assert af.findings[0].metrics == {"average_position_vs_you": Decimal("-0.5")}
+    assert af.findings[1].metrics == {"estimated_cpc": Decimal("1.25")}
+    assert af.index["competition"] == {"competitors_identified": Decimal("2")}
+
+    sample["detailed_findings"]["keyword_gaps"][0]["search_volume"] = -10
+    with pytest.raises(NegativeMetricError):
+        parse_competitor_insights(sample)
+
+
+def test_competitor_insights_date_fallbacks():
+    """Test date range falls back from analysis_period to timestamp to today."""
+    base = {"analyzer": "CompetitorInsightsAnalyzer", "detailed_findings": {}}
+    af = parse_competitor_insights(
+        {**base, "analysis_period": {"start_date": "bad"}, "timestamp": "2025-08-24T12:00:00"}
+    )
+    assert af.date_range.start_date == af.date_range.end_date == date(2025, 8, 24)
+    assert af.analyzers[0].finished_at == datetime(2025, 8, 24, 12)
+
+    af = parse_competitor_insights({**base, "timestamp": "not a date"})
+    assert af.date_range.start_date == datetime.now(timezone.utc).date()
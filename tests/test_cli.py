@@ -2,12 +2,14 @@
 
 import json
 import tempfile
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from nav_insights.cli import ValidatorCLI
+from nav_insights import cli as cli_module
+from nav_insights.cli import ValidatorCLI, _scan_schemas, clear_schema_cache, main
 
 
 class TestValidatorCLI:
@@ -71,6 +73,12 @@ class TestValidatorCLI:
             payload = self.cli.load_payload("-")
             assert payload == test_payload
 
+    def test_load_payload_stdin_binary(self):
+        """Test that stdin is read through its binary buffer when present."""
+        stdin = TextIOWrapper(BytesIO('{"name": "caf\u00e9"}'.encode("utf-8")), encoding="utf-8")
+        with patch("sys.stdin", stdin):
+            assert self.cli.load_payload("-") == {"name": "caf\u00e9"}
+
     def test_load_payload_invalid_json(self):
         """Test loading invalid JSON payload."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
@@ -83,6 +91,23 @@ class TestValidatorCLI:
         finally:
             Path(temp_path).unlink()
 
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            b'{"id": 123456789012345678901234567890, "neg": -9223372036854775809}',
+            b'{"cost": NaN, "cap": Infinity, "floor": -Infinity}',
+            b'{"big": 1e400}',
+        ],
+    )
+    def test_load_payload_matches_stdlib_json(self, tmp_path, raw):
+        """Payloads parse identically with or without orjson installed."""
+        path = tmp_path / "payload.json"
+        path.write_bytes(raw)
+        payload = self.cli.load_payload(str(path))
+        expected = json.loads(raw)
+        assert repr(payload) == repr(expected)
+        assert [type(v) for v in payload.values()] == [type(v) for v in expected.values()]
+
     def test_load_payload_nonexistent_file(self):
         """Test loading from nonexistent file."""
         with pytest.raises(ValueError, match="Input file not found"):
@@ -118,6 +143,13 @@ class TestValidatorCLI:
         assert "age" in errors[0]
         assert "required" in errors[0].lower()
 
+    def test_validate_payload_without_error_collection(self):
+        """Test the pass/fail-only validation path."""
+        schema = {"type": "object", "required": ["name"]}
+
+        assert self.cli.validate_payload({"name": "x"}, schema, collect_errors=False) == (True, [])
+        assert self.cli.validate_payload({}, schema, collect_errors=False) == (False, [])
+
     def test_validate_payload_type_mismatch(self):
         """Test validation with type mismatch."""
         schema = {
@@ -241,6 +273,107 @@ class TestValidatorCLI:
         # Should be in cache
         assert analyzer_type in self.cli._schema_cache
 
+    def test_schema_discovery_caching(self):
+        """Test that schema discovery is cached and can be cleared."""
+        clear_schema_cache()
+        types = self.cli.get_available_types()
+        ValidatorCLI().get_available_types()
+        assert _scan_schemas.cache_info().hits >= 1
+
+        # Callers get their own list, not the cached tuple
+        types.append("mutated")
+        assert "mutated" not in self.cli.get_available_types()
+
+        path = self.cli.get_schema_path("paid_search.keyword_analyzer")
+        assert self.cli.get_schema_path("paid_search.keyword_analyzer") is path
+
+    def test_validator_caching(self):
+        """Test that compiled validators are reused across calls and instances."""
+        schema = self.cli.load_schema("paid_search.keyword_analyzer")
+        validator = self.cli._get_validator_for(schema)
+
+        assert self.cli._get_validator_for(schema) is validator
+        assert ValidatorCLI().load_schema("paid_search.keyword_analyzer") is schema
+
+    def test_validate_payload_stream_matches_full_validation(self):
+        """Test that streaming validation reports the same result as a full load."""
+        pytest.importorskip("ijson")
+        schema = self.cli.load_schema("paid_search.keyword_analyzer")
+        fixture = Path(__file__).parent / "fixtures" / "keyword_analyzer_happy_path.json"
+
+        assert self.cli.validate_payload_stream(str(fixture), schema) == (True, [])
+
+        payload = json.loads(fixture.read_text())
+        del payload["customer_id"]
+        payload["summary"] = "not an object"
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(payload, f)
+            temp_path = f.name
+
+        try:
+            is_valid, errors = self.cli.validate_payload_stream(temp_path, schema)
+            full_valid, full_errors = self.cli.validate_payload(payload, schema)
+            assert is_valid is full_valid is False
+            assert sorted(errors) == sorted(full_errors)
+        finally:
+            Path(temp_path).unlink()
+
+    def test_validate_payload_stream_validates_array_items_one_at_a_time(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that streamed arrays are validated per item, never built whole."""
+        pytest.importorskip("ijson")
+        schema = {
+            "type": "object",
+            "properties": {
+                "detailed_findings": {
+                    "type": "object",
+                    "properties": {
+                        "keywords": {
+                            "type": "array",
+                            "items": {
+                                "type": "object",
+                                "properties": {"cost": {"type": "number"}},
+                                "required": ["keyword"],
+                            },
+                        }
+                    },
+                    "additionalProperties": {"type": "array"},
+                },
+                "summary": {"type": "object", "additionalProperties": True},
+            },
+            "required": ["detailed_findings"],
+        }
+        keywords = [{"keyword": f"k{i}", "cost": i} for i in range(50)]
+        keywords[3] = {"cost": 1}
+        keywords[7]["cost"] = "free"
+        payload = {
+            "summary": {"nested": [1, 2, {"a": None}]},
+            "detailed_findings": {"keywords": keywords, "other": "not an array"},
+        }
+        path = tmp_path / "payload.json"
+        path.write_text(json.dumps(payload))
+
+        built = []
+        build_value = cli_module._build_value
+
+        def spy(*args):
+            built.append(build_value(*args))
+            return built[-1]
+
+        monkeypatch.setattr(cli_module, "_build_value", spy)
+        is_valid, errors = self.cli.validate_payload_stream(str(path), schema)
+        full_valid, full_errors = self.cli.validate_payload(payload, schema)
+
+        assert is_valid is full_valid is False
+        assert sorted(errors) == sorted(full_errors)
+        assert (
+            "At 'detailed_findings -> keywords -> [7] -> cost': 'free' is not of type 'number'"
+            in errors
+        )
+        assert not any(isinstance(value, list) for value in built)
+        assert payload["summary"] not in built
+
     def test_validate_schema_itself(self):
         """Test schema self-validation."""
         # Valid schema
@@ -291,3 +424,23 @@ class TestValidatorCLI:
         """Test error for invalid analyzer type format."""
         with pytest.raises(ValueError, match="Invalid analyzer type format"):
             self.cli.load_schema("invalid_format_no_dot")
+
+    def test_main_validate_multiple_inputs(self):
+        """Test validating several files, including a glob, in one invocation."""
+        fixtures = Path(__file__).parent / "fixtures"
+        good = fixtures / "keyword_analyzer_happy_path.json"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bad = Path(tmp_dir) / "bad.json"
+            bad.write_text("{}")
+            argv = ["nav-insights", "validate", "--type", "paid_search.keyword_analyzer"]
+            argv += ["--input", str(good), str(Path(tmp_dir) / "*.json")]
+
+            with patch("sys.argv", argv):
+                with patch("builtins.print") as mock_print:
+                    result = main()
+
+        assert result == 1
+        mock_print.assert_any_call(f"{good}:")
+        mock_print.assert_any_call(f"{bad}:")
+        mock_print.assert_any_call("✅ Payload is valid")
+        mock_print.assert_any_call("❌ Payload validation failed:")
@@ -21,6 +21,11 @@ import pytest
 
 from nav_insights.core.ir_base import (
     Money,
+    EntityRef,
+    EntityType,
+    Evidence,
+    Finding,
+    FindingCategory,
     AccountMeta,
     DateRange,
     Totals,
@@ -79,6 +84,27 @@ class TestCoreIRTypes:
         with pytest.raises(ValueError, match="end_date must be >= start_date"):
             DateRange(start_date=date(2025, 7, 31), end_date=date(2025, 7, 1))
 
+    def test_leaf_models_frozen_and_finding_build(self):
+        """Test leaf models are immutable and Finding.build matches validation"""
+        money = Money(amount=Decimal("1"))
+        entity = EntityRef(type=EntityType.keyword, id="kw:x", name="x")
+        evidence = Evidence(source="test", entities=[entity])
+        for obj, field in ((money, "amount"), (entity, "id"), (evidence, "source")):
+            with pytest.raises(ValueError):
+                setattr(obj, field, None)
+
+        data = dict(
+            id="F1",
+            category=FindingCategory.keywords,
+            summary="s",
+            entities=[entity],
+            metrics={"cost": Decimal("1.5")},
+            evidence=[evidence],
+        )
+        built = Finding.build(**data)
+        assert built == Finding(**data)
+        assert built.model_dump() == Finding(**data).model_dump()
+
     def test_json_schema_export(self):
         """Test JSON Schema export available for each model"""
         # Test individual model schema export
@@ -108,6 +134,19 @@ class TestCoreIRTypes:
             assert isinstance(all_schemas[model_name], dict)
             assert "properties" in all_schemas[model_name]
 
+    def test_json_schema_export_returns_independent_copies(self):
+        """Mutating an exported schema must not leak into later calls"""
+        money_schema = get_model_json_schema(Money)
+        expected = get_model_json_schema(Money)
+        money_schema["properties"]["amount"]["title"] = "changed"
+        money_schema["injected"] = True
+        assert get_model_json_schema(Money) == expected
+
+        all_schemas = export_all_schemas()
+        all_schemas["Finding"]["properties"].clear()
+        assert export_all_schemas()["Finding"] == get_model_json_schema(Finding)
+        assert export_all_schemas()["Finding"]["properties"]
+
 
 class TestFixtureValidation:
     """Test fixture validation for Search and Social domains"""
@@ -1,7 +1,13 @@
 """Tests for core utilities and error handling."""
 
+import decimal
+import subprocess
+import sys
+
 import pytest
 from decimal import Decimal
+import nav_insights
+import nav_insights.core as core
 from nav_insights.core import (
     CoreError,
     ValidationError,
@@ -12,6 +18,7 @@ from nav_insights.core import (
     generate_finding_id,
     validate_non_negative_metrics,
     safe_decimal_conversion,
+    to_decimal,
     validate_required_fields,
     wrap_exception,
 )
@@ -150,6 +157,12 @@ class TestFindingIdGeneration:
         assert "!" not in finding_id
         assert "@" not in finding_id
 
+    def test_generate_finding_id_collapses_runs_and_keeps_unicode(self):
+        """Test that separator runs collapse and non-ASCII letters are kept."""
+        finding_id = generate_finding_id("TEST", "__café -- crème__", "a!!b")
+        assert finding_id.startswith("TEST_CAFÉ_CRÈME_A_B_")
+        assert generate_finding_id("TEST", "!!!").startswith("TEST_")
+
     def test_generate_finding_id_deterministic(self):
         """Test that ID generation is deterministic."""
         id1 = generate_finding_id("TEST", "entity", "type")
@@ -224,6 +237,14 @@ class TestMetricValidation:
         assert safe_decimal_conversion("50.25", "amount") == Decimal("50.25")
         assert safe_decimal_conversion(0, "zero") == Decimal("0")
 
+    def test_non_finite_values_rejected(self):
+        """Test NaN/Infinity are rejected rather than passed through."""
+        for bad in ("NaN", "Infinity", float("-inf")):
+            with pytest.raises(ValidationError, match="must be a finite number"):
+                validate_non_negative_metrics({"cost": bad}, ["cost"], "TestParser")
+            with pytest.raises(ValidationError, match="must be a finite number"):
+                safe_decimal_conversion(bad, "position")
+
     def test_safe_decimal_conversion_none(self):
         """Test safe decimal conversion with None."""
         assert safe_decimal_conversion(None, "cost") == Decimal("0")
@@ -240,6 +261,15 @@ class TestMetricValidation:
             safe_decimal_conversion("invalid", "cost")
         assert "Cannot convert 'cost' to decimal" in str(exc_info.value)
 
+    def test_to_decimal_matches_str_conversion(self):
+        """Test memoized conversion agrees with Decimal(str(value))."""
+        for value in (0, 1, 1.0, 12.5, -0.0, 0.0, "3.25", "1.0", Decimal("1.0")):
+            result = to_decimal(value)
+            assert str(result) == str(Decimal(str(value)))
+        assert str(to_decimal(Decimal("2.50"))) == "2.50"
+        with pytest.raises(decimal.InvalidOperation):
+            to_decimal("invalid")
+
     def test_validate_required_fields_all_present(self):
         """Test required field validation with all fields present."""
         data = {"field1": "value1", "field2": "value2", "field3": "value3"}
@@ -268,3 +298,24 @@ class TestMetricValidation:
             validate_required_fields(data, ["field1", "field2", "field3"], "TestParser")
         assert "field2" in str(exc_info.value)
         assert "field3" in str(exc_info.value)
+
+
+class TestLazyExports:
+    """Test the lazily resolved nav_insights.core re-exports."""
+
+    def test_package_import_does_not_load_submodules(self):
+        """Importing the package alone should not import errors/utils."""
+        code = (
+            "import sys, nav_insights.core; "
+            "print('nav_insights.core.errors' in sys.modules, "
+            "'nav_insights.core.utils' in sys.modules)"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert out.stdout.strip() == "False False"
+
+    def test_exports_resolve(self):
+        """Every name in __all__ resolves, including via the top-level package."""
+        for name in core.__all__:
+            assert getattr(core, name) is getattr(nav_insights, name)
+        with pytest.raises(AttributeError):
+            core.not_a_real_name
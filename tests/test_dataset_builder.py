@@ -0,0 +1,39 @@
+"""Tests for dataset_builder JSON encoding."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from nav_insights import dataset_builder
+
+SAMPLE_IR = Path(__file__).parent.parent / "examples" / "sample_ir_search.json"
+
+
+def _encode(obj):
+    try:
+        return dataset_builder.minijson_bytes(obj)
+    except (TypeError, ValueError) as e:
+        return type(e)
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        json.loads(SAMPLE_IR.read_text()),
+        {"nan": float("nan"), "inf": float("inf"), "neg": float("-inf")},
+        [1e16, 1e-05, 1.5e300, 5e-324, 0.1, -0.0, 123456.789],
+        {"text": 'héllo ☃   \x00\x1f"\\'},
+        {1: "int key", "s": (1, 2)},
+        {"wide": 2**70},
+        {"when": datetime(2024, 1, 2, 3, 4, 5)},
+    ],
+)
+def test_minijson_same_with_and_without_orjson(obj, monkeypatch):
+    result = _encode(obj)
+    monkeypatch.setattr(dataset_builder, "orjson", None)
+    assert result == _encode(obj)
+    expected = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+    if not isinstance(result, type):
+        assert result == expected.encode("utf-8")
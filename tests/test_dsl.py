@@ -1,7 +1,15 @@
 """Comprehensive tests for the DSL expression evaluator and registry system."""
 
+import ast
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Dict, List, Optional
+
 import pytest
+from pydantic import BaseModel, Field, field_serializer
 from nav_insights.core.dsl import (
+    SafeEval,
+    compile_expr,
     eval_expr,
     value,
     DSLRegistry,
@@ -12,7 +20,18 @@ from nav_insights.core.dsl import (
     UnsupportedNodeError,
     HelperNotFoundError,
     ResourceLimitError,
+    _compile,
+    _path_getter,
+    eval_expr_batch,
 )
+from nav_insights.core.findings_ir import Severity
+from nav_insights.core.rules import _compile_condition
+
+
+def _reference_eval(expr, root):
+    """Evaluate with the tree-walking SafeEval, as eval_expr originally did."""
+    ctx = {"value": lambda p, d=None: value(p, root, d), "root": root}
+    return SafeEval(ctx).visit(ast.parse(expr, mode="eval"))
 
 
 class TestValueAccessor:
@@ -634,3 +653,267 @@ class TestSecuredValueAccess:
         obj = DictLike({"key": "value"})
         assert value("key", obj) == "value"
         assert value("missing", obj, "default") == "default"
+
+
+class TestCompiledEvaluation:
+    """Test the compile-once evaluation path used by eval_expr."""
+
+    def test_compiled_code_is_cached(self):
+        expr = "value('a') + 1"
+        assert eval_expr(expr, {"a": 1}) == 2
+        program, _ = _compile(expr)
+        assert eval_expr(expr, {"a": 41}) == 42
+        assert _compile(expr)[0] is program
+
+    def test_compile_expr_reuses_program(self):
+        fn = compile_expr("value('a') * 2 > 3")
+        assert [fn({"a": a}) for a in (1, 2, None)] == [False, True, False]
+
+        registry = DSLRegistry()
+        registry.register_function("double", lambda x: x * 2)
+        assert compile_expr("double(value('a'))", registry)({"a": 4}) == 8
+
+        with pytest.raises(ResourceLimitError):
+            compile_expr("1 + 1", max_length=3)
+        with pytest.raises(UnsupportedNodeError):
+            compile_expr("value.attr")
+
+    def test_helper_resolution_cached_until_registry_changes(self):
+        registry = DSLRegistry()
+        registry.register_function("double", lambda x: x * 2)
+        assert eval_expr("double(2)", {}, registry) == 4
+        caller = registry.resolve("double")
+        assert registry.resolve("double") is caller
+
+        with pytest.raises(HelperNotFoundError):
+            eval_expr("triple(2)", {}, registry)
+        registry.register_function("triple", lambda x: x * 3)
+        assert registry.resolve("double") is not caller
+        assert eval_expr("triple(2)", {}, registry) == 6
+
+    def test_eval_expr_batch(self):
+        roots = [{"cost": 10, "clicks": 5}, {"cost": 3, "clicks": 0}, {"cost": None}]
+        expr = "value('cost') / max(value('clicks', 1), 1) > 1"
+        assert eval_expr_batch(expr, roots) == [eval_expr(expr, r) for r in roots]
+        assert eval_expr_batch(expr, []) == []
+        with pytest.raises(ResourceLimitError):
+            eval_expr_batch(expr, roots, max_length=5)
+
+    def test_cache_controls_exposed_on_eval_expr(self):
+        eval_expr("1 + 1", {})
+        assert eval_expr.cache_info().currsize >= 1
+        eval_expr.cache_clear()
+        assert eval_expr.cache_info().currsize == 0
+        assert eval_expr("1 + 1", {}) == 2
+
+    def test_constant_subexpressions_are_folded(self):
+        program, _ = _compile("value('m.spend') > 100 * 0.9")
+        assert 90.0 in program.__code__.co_consts
+        assert eval_expr("value('m.spend') > 100 * 0.9", {"m": {"spend": 95}}) is True
+        assert eval_expr("-(2 + 3) < 1 < 2", {}) is True
+
+    def test_none_checks_skip_comparison_helpers(self):
+        for expr in ["value('a') == None", "None != value('a')"]:
+            program, _ = _compile(expr)
+            assert not {"_eq", "_noteq"} & set(program.__code__.co_names)
+        data = {"a": 0, "n": None}
+        assert eval_expr("value('a') == None", data) is False
+        assert eval_expr("value('n') == None", data) is True
+        assert eval_expr("None != value('a')", data) is True
+        assert eval_expr("value('n') != None", data) is False
+
+    def test_builtin_calls_on_constants_are_folded(self):
+        program, _ = _compile("value('a') > max(1, 2) * 10")
+        assert 20 in program.__code__.co_consts
+        assert "_resolve_helper" not in program.__code__.co_names
+        assert eval_expr("value('a') > max(1, 2) * 10", {"a": 25}) is True
+        with pytest.raises(ExpressionError):
+            eval_expr("min()", {})
+
+        registry = DSLRegistry()
+        with pytest.raises(ValueError, match="shadow a built-in"):
+            registry.register_accessor("max", lambda root: lambda *a: 0)
+
+    def test_folding_keeps_runtime_errors_and_short_circuit(self):
+        assert eval_expr("False and 1 / 0", {}) is False
+        with pytest.raises(ExpressionError, match="Arithmetic error"):
+            eval_expr("True and 1 / 0", {})
+        assert eval_expr("None + 1 == None", {}) is True
+
+    def test_folding_skips_large_or_failing_constants(self):
+        for expr in [
+            "False and 'a' * 9999999999999999999",
+            "False and 'ab' * 400000000",
+            "False and '%0999999999d' % 1",
+        ]:
+            program, error = _compile(expr)
+            assert error is None
+            assert all(len(c) <= 4096 for c in program.__code__.co_consts if isinstance(c, str))
+            assert eval_expr(expr, {}) is False
+            assert compile_expr(expr)({}) is False
+        program, _ = _compile("value('a') == 'ab' * 3")
+        assert "ababab" in program.__code__.co_consts
+
+    def test_reference_interpreter_comparisons_match(self):
+        data = {"a": 1, "n": None}
+        for expr in [
+            "1 < value('a') <= 2",
+            "value('n') == None != 1",
+            "value('n') < 1",
+            "3 > 2 > 2",
+        ]:
+            ctx = {"value": lambda path, default=None: value(path, data, default)}
+            tree = ast.parse(expr, mode="eval")
+            assert SafeEval(ctx).visit(tree) == eval_expr(expr, data)
+
+    def test_literal_paths_match_value(self):
+        class Inner(BaseModel):
+            x: int = 3
+
+        class Outer(BaseModel):
+            inner: Inner = Inner()
+
+        roots = [
+            {"a": {"b": 1}},
+            {"a": None},
+            {"a": OrderedDict(b=2)},
+            {"a": Outer()},
+            Outer(),
+            {"a": [1, 2]},
+            None,
+        ]
+        for path in ["a", "a.b", "a.inner.x", "inner.x", "a.b.c"]:
+            for root in roots:
+                assert _path_getter(path)(root) == value(path, root)
+                assert eval_expr(f"value('{path}', -1)", root) == value(path, root, -1)
+
+    def test_pydantic_paths_match_model_dump(self):
+        class Leaf(BaseModel):
+            amount: Decimal = Decimal("1.5")
+            severity: Severity = Severity.high
+
+        class Node(BaseModel):
+            leaf: Leaf = Leaf()
+            leaves: List[Leaf] = [Leaf()]
+            by_name: Dict[str, Leaf] = {"x": Leaf()}
+            missing: Optional[Leaf] = None
+
+        class Root(BaseModel):
+            node: Node = Node()
+
+        root = Root()
+        dumped = root.model_dump()
+        paths = [
+            "node",
+            "node.leaf",
+            "node.leaf.amount",
+            "node.leaf.severity",
+            "node.leaves",
+            "node.by_name",
+            "node.by_name.x",
+            "node.by_name.x.amount",
+            "node.missing",
+            "node.missing.amount",
+            "node.nope",
+            "node.leaf.amount.more",
+        ]
+        for path in paths:
+            assert value(path, root) == value(path, dumped), path
+            assert eval_expr(f"value('{path}')", root) == value(path, dumped), path
+
+    def test_excluded_pydantic_field_not_readable(self):
+        class Account(BaseModel):
+            name: str = "acme"
+            secret: str = Field("s", exclude=True)
+
+        class Wrapper(BaseModel):
+            account: Account = Account()
+
+        assert value("secret", Account()) is None
+        assert value("account.secret", Wrapper(), "hidden") == "hidden"
+        assert eval_expr("value('account.secret')", Wrapper()) is None
+        assert value("account.name", Wrapper()) == "acme"
+
+    def test_serialized_pydantic_field_matches_model_dump(self):
+        class Tagged(BaseModel):
+            code: str = "abc"
+            count: int = 2
+
+            @field_serializer("code")
+            def _upper(self, v: str) -> str:
+                return v.upper()
+
+        class Wrapper(BaseModel):
+            tagged: Tagged = Tagged()
+
+        assert value("code", Tagged()) == "ABC"
+        assert value("tagged.code", Wrapper()) == "ABC"
+        assert eval_expr("value('tagged.code')", Wrapper()) == "ABC"
+        assert value("tagged.count", Wrapper()) == 2
+
+    def test_repeated_literal_paths_resolved_once(self):
+        calls = []
+
+        class Tracking(dict):
+            def get(self, key, default=None):
+                calls.append(key)
+                return super().get(key, default)
+
+        root = Tracking(spend=200, clicks=Tracking(total=50))
+        expr = "value('spend') > 0 and value('spend') / value('clicks.total') > 3"
+        assert eval_expr(expr, root) is True
+        assert calls.count("spend") == 1
+        assert eval_expr("False and value('x') or value('x', 7)", {}) == 7
+
+    def test_chained_comparison_evaluates_operands_once(self):
+        calls = []
+
+        def tick(x):
+            calls.append(x)
+            return x
+
+        registry = DSLRegistry()
+        registry.register_function("tick", tick)
+
+        assert eval_expr("1 < tick(2) < 3", {}, registry) is True
+        assert calls == [2]
+        assert eval_expr("1 < tick(0) < 3", {}, registry) is False
+
+    def test_sandbox_has_no_builtins(self):
+        with pytest.raises(UnsupportedNodeError):
+            eval_expr("__builtins__", {})
+        with pytest.raises(HelperNotFoundError):
+            eval_expr("len('abc')", {})
+
+    def test_lazy_validation_matches_reference_interpreter(self):
+        # Nodes the compiler rejects only raise if evaluation reaches them,
+        # exactly as with SafeEval; compile_expr stays strict
+        for expr, expected in [
+            ("True or foo", True),
+            ("False and value.attr", False),
+            ("max(1, 2, key=None)", 2),
+            ("value('x', default=3)", 1),
+        ]:
+            assert eval_expr(expr, {"x": 1}) == expected
+            assert eval_expr(expr, {"x": 1}) == _reference_eval(expr, {"x": 1})
+            with pytest.raises(UnsupportedNodeError):
+                compile_expr(expr)
+        with pytest.raises(UnsupportedNodeError, match="Name not allowed"):
+            eval_expr("False or foo", {})
+
+    def test_missing_helper_reported_before_arguments(self):
+        with pytest.raises(HelperNotFoundError):
+            eval_expr("unknown(1 / 0)", {})
+
+    def test_deep_nesting_within_length_limit_hits_depth_limit(self):
+        for expr in ["1" + "+1" * 340, "-" * 900 + "1", "+".join(["value('a')"] * 90)]:
+            assert len(expr) <= 1024
+            with pytest.raises(ResourceLimitError, match="depth exceeds limit"):
+                eval_expr(expr, {"a": 1})
+            with pytest.raises(ResourceLimitError):
+                compile_expr(expr)
+            # Rules defer the error to evaluation instead of failing at load
+            condition = _compile_condition(expr)
+            with pytest.raises(ResourceLimitError):
+                condition({"a": 1})
+        assert eval_expr("True or " + "-" * 900 + "1", {}) is True
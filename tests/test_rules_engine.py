@@ -1,7 +1,20 @@
 import json
+import os
 import pathlib
 
-from nav_insights.core.rules import evaluate_rules
+import pytest
+from pydantic import ValidationError
+
+from nav_insights.core import rules
+from nav_insights.core.actions import Action, ActionImpact
+from nav_insights.core.rules import (
+    _compile_value_or_expr,
+    _render,
+    _template,
+    clear_rule_cache,
+    compile_rules,
+    evaluate_rules,
+)
 
 
 def test_rules_emit_expected_actions():
@@ -18,3 +31,148 @@ def test_rules_emit_expected_actions():
         "GEO_WASTE_OUTLIERS",
         "TRACKING_GAPS",
     } <= src_ids
+
+
+def test_rule_actions_match_validated_construction():
+    base = pathlib.Path(__file__).parent.parent
+    ir = json.loads((base / "examples" / "sample_ir_search.json").read_text())
+    rules_path = str(base / "nav_insights" / "domains" / "paid_search" / "rules" / "default.yaml")
+    for a in evaluate_rules(ir, rules_path):
+        assert Action.model_validate(a.model_dump()) == a
+        with pytest.raises(ValidationError):
+            a.priority = 5
+
+
+def test_action_ignores_unknown_keys():
+    # Client payloads (service, writer output) may carry extra keys
+    a = Action(id="A1", target="x", justification="", client_note="n", expected_impact={"x": 1})
+    assert "client_note" not in a.model_dump()
+    assert a.expected_impact == ActionImpact()
+
+
+def test_invalid_rule_action_fails_only_when_fired(tmp_path):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(
+        "- id: BAD\n  if_all:\n    - expr: 'value(\"fire\", False)'\n"
+        "  action: { type: not_a_type, target: x }\n"
+        "- id: OK\n  if_all: []\n  action: { type: other, target: x }\n"
+    )
+    clear_rule_cache()
+    assert [a.id for a in evaluate_rules({}, str(rules_file))] == ["OK_ACT_1"]
+    with pytest.raises(ValidationError):
+        evaluate_rules({"fire": True}, str(rules_file))
+
+
+def test_emitted_actions_do_not_share_params(tmp_path):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(
+        "- id: NESTED\n  if_all: []\n"
+        "  action: { type: other, target: x, params: { terms: [a, b], meta: { n: 1 } } }\n"
+    )
+    clear_rule_cache()
+    first = evaluate_rules({}, str(rules_file))[0]
+    first.params["terms"].append("c")
+    first.params["meta"]["n"] = 2
+    second = evaluate_rules({}, str(rules_file))[0]
+    assert second.params == {"terms": ["a", "b"], "meta": {"n": 1}}
+
+
+def test_compile_rules_survives_deleted_file(tmp_path):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text("- id: R\n  if_all: []\n  action: { type: other, target: x }\n")
+    clear_rule_cache()
+    run = compile_rules(str(rules_file))
+    rules_file.unlink()
+    assert compile_rules(str(rules_file)) is run
+    assert [a.id for a in evaluate_rules({}, str(rules_file))] == ["R_ACT_1"]
+
+    clear_rule_cache()
+    with pytest.raises(FileNotFoundError):
+        evaluate_rules({}, str(rules_file))
+
+
+def test_action_labels_are_interned():
+    def make(i):
+        # Build equal strings at runtime so they start out as distinct objects
+        return Action(
+            id=str(i), target="".join(["top_", "broad"]), justification="", source_rule_id="R" * 3
+        )
+
+    a, b = make(1), make(2)
+    assert a.target is b.target
+    assert a.source_rule_id is b.source_rule_id
+
+
+def test_compile_rules_is_cached_until_file_changes(tmp_path):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(
+        "- id: HIGH_SPEND\n"
+        "  if_all:\n"
+        "    - expr: 'value(\"totals.spend\") > 100'\n"
+        "  action: { type: other, target: account }\n"
+        "- id: UNREACHED\n"
+        "  if_all:\n"
+        "    - expr: 'False'\n"
+        "    - expr: 'value.attr'\n"
+        "  action: { type: other, target: account }\n"
+    )
+    run = compile_rules(str(rules_file))
+    assert compile_rules(str(rules_file)) is run
+
+    # The unsupported expression is never reached, so it does not raise
+    actions = run({"totals": {"spend": 150}})
+    assert [a.id for a in actions] == ["HIGH_SPEND_ACT_1"]
+    assert run({"totals": {"spend": 50}}) == []
+
+    rules_file.write_text("[]\n")
+    stat = rules_file.stat()
+    os.utime(rules_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert compile_rules(str(rules_file))({"totals": {"spend": 150}}) == []
+
+
+def test_expected_impact_expressions_and_literals():
+    impact = _compile_value_or_expr(
+        {"spend": 'value("m.waste", 0) * 2', "risk": "low", "bad": "1 / value('m.zero')", "n": 3}
+    )
+    assert impact({"m": {"waste": 5, "zero": 0}}) == {
+        "spend": 10,
+        "risk": "low",
+        "bad": "1 / value('m.zero')",
+        "n": 3,
+    }
+    assert impact({})["spend"] == 0
+
+
+def test_justification_templates_compiled_once():
+    clear_rule_cache()
+    tpl = "{{ pct(value('a')) }} of {{ usd(value('b')) }}, {{ usd(value('missing')) }}"
+    assert _render(tpl, {"root": {"a": 0.52, "b": 1300}}) == "52% of $1,300, n/a"
+    assert _render(tpl, {"root": {"a": 0.1, "b": 5}}) == "10% of $5, n/a"
+    assert _template.cache_info().misses == 1
+
+
+def test_plain_text_justification_skips_rendering(tmp_path, monkeypatch):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(
+        "- id: PLAIN\n  if_all: []\n  action: { type: other, target: x }\n"
+        "  justification_template: '  Plain text.  '\n"
+        "- id: DESC\n  if_all: []\n  action: { type: other, target: x }\n"
+        "  description: Described.\n"
+    )
+    clear_rule_cache()
+    monkeypatch.setattr(rules, "_render", None)
+    actions = evaluate_rules({}, str(rules_file))
+    assert [a.justification for a in actions] == ["Plain text.", "Described."]
+
+
+def test_static_expected_impact_validated_once(tmp_path):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(
+        "- id: STATIC\n  if_all: []\n  action: { type: other, target: x }\n"
+        "  expected_impact: { spend_savings_usd: 5, risk: low }\n"
+    )
+    clear_rule_cache()
+    first = evaluate_rules({}, str(rules_file))[0].expected_impact
+    second = evaluate_rules({}, str(rules_file))[0].expected_impact
+    assert first is second
+    assert first.spend_savings_usd == 5 and first.risk == "low"
@@ -0,0 +1,29 @@
+"""Tests for the FastAPI service wrapper (skipped when fastapi is not installed)."""
+
+import pytest
+
+service = pytest.importorskip("nav_insights.service")
+testclient = pytest.importorskip("fastapi.testclient")
+
+
+class _StubInsight:
+    def model_dump_json(self):
+        return "{}"
+
+
+def test_compose_accepts_actions_with_unknown_keys(monkeypatch):
+    captured = {}
+
+    def fake_compose(ir, actions, *args):
+        captured["actions"] = actions
+        return _StubInsight()
+
+    monkeypatch.setattr(service, "compose_insight_json", fake_compose)
+    client = testclient.TestClient(service.app)
+    action = {"id": "A1", "target": "x", "justification": "j", "client_note": "ignored"}
+    resp = client.post("/v1/insights:compose", json={"ir": {}, "actions": [action]})
+
+    assert resp.status_code == 200
+    (built,) = captured["actions"]
+    assert built.id == "A1"
+    assert "client_note" not in built.model_dump()